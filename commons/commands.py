@@ -131,9 +131,11 @@ EXTRACT_LOG_CMD = "cat {} | grep '{}' > '/root/extracted_alert.log'"
 SEL_INFO_CMD = "ipmitool sel info"
 SEL_LIST_CMD = "ipmitool sel list"
 IEM_LOGGER_CMD = "logger -i -p local3.err {}"
-INSTALL_SCREEN_CMD = "yum -y install screen"
+INSTALL_SCREEN_CMD = "rpm -q screen || yum -y install screen"
 INSTALL_SSH_PASS_CMD = "yum -y install sshpass"  # nosec
 SCREEN_CMD = "screen -d -m -L -S 'screen_RMQ' {}"
+CHECK_SCREEN_CMD = "command -v screen"
+SCREEN_SESSION_CHECK_CMD = "screen -ls | grep -q 'screen_RMQ' && echo ready"
 SSH_CMD = "sshpass -p {} ssh -o 'StrictHostKeyChecking no' {}@{} {}"
 RESOLVE_FAN_FAULT = "ipmitool event {} {} deassert"
 CPU_USAGE_CMD = "python3 -c 'import psutil; print(psutil.cpu_percent(interval=1))'"
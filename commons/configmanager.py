@@ -19,7 +19,11 @@
 #
 """Module for handling the yaml config and DB config and combine them"""
 
+import copy
 import logging
+import os
+import threading
+from collections import OrderedDict
 from urllib.parse import quote_plus
 import yaml
 from pymongo import MongoClient
@@ -29,6 +33,11 @@ from commons.params import SETUPS_FPATH, DB_HOSTNAME, DB_NAME, SYS_INFO_COLLECTI
 
 LOG = logging.getLogger(__name__)
 
+# Parsed and decrypted yaml configs keyed by path and file signature
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_SIZE = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 def get_config_yaml(fpath: str) -> dict:
     """Reads the config and decrypts the passwords
@@ -36,13 +45,25 @@ def get_config_yaml(fpath: str) -> dict:
     :param fpath: configuration file path
     :return [type]: dictionary containing config data
     """
-    with open(fpath) as fin:
-        LOG.debug("Reading details from file : %s", fpath)
-        data = yaml.safe_load(fin)
-        data['end'] = 'end'
-        LOG.debug("Decrypting password from file : %s", fpath)
-        pswdmanager.decrypt_all_passwd(data)
-    return data
+    stat = os.stat(fpath)
+    key = (os.path.abspath(fpath), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    with _YAML_CACHE_LOCK:
+        data = _YAML_CACHE.get(key)
+        if data is not None:
+            _YAML_CACHE.move_to_end(key)
+    if data is None:
+        with open(fpath) as fin:
+            LOG.debug("Reading details from file : %s", fpath)
+            data = yaml.safe_load(fin)
+            data['end'] = 'end'
+            LOG.debug("Decrypting password from file : %s", fpath)
+            pswdmanager.decrypt_all_passwd(data)
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[key] = data
+            if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+    # Callers update the returned config, keep the cached copy pristine
+    return copy.deepcopy(data)
 
 
 def get_config_db(setup_query: dict, drop_id: bool = True):
@@ -227,6 +227,8 @@ class Rest:
     BUCKET = "buckets"
     NAME = "name"
     LOGIN_PAYLOAD = "{\"username\":\"$username\",\"password\":\"$password\"}"
+    # Seconds a cached login token is reused, kept below the 300s token lifetime
+    AUTH_CACHE_TTL = 280
     BUCKET_PAYLOAD = "{\"bucket_name\":\"buk$value\"}"
     BUCKET_POLICY_PAYLOAD = "{\"Statement\": [{\"Action\": [\"s3:$s3operation\"]," \
                             "\"Effect\": \"$effect\",\"Resource\": \"arn:aws:s3:::$value/*\"," \
@@ -40,6 +40,9 @@ from commons import commands, const
 
 LOGGER = logging.getLogger(__name__)
 
+# Marker echoed between the commands of a batch to split their output
+BATCH_SEPARATOR = "__CTP_BATCH_SEPARATOR__"
+
 
 class AbsHost:
     """Abstract class for establishing connections."""
@@ -234,6 +237,25 @@ class Host(AbsHost):
 
         return stdout.read(read_nbytes)
 
+    def execute_batch(self, cmds: List[str], **kwargs) -> List[str]:
+        """
+        Execute independent commands in a single remote shell invocation.
+        Commands run in order separated by ';', so a failing command does not stop the
+        next one; exit status and exception handling follow the last command.
+        :param cmds: commands to be executed.
+        :param kwargs: keyword arguments passed to execute_cmd.
+        :return: decoded stdout of every command, in command order.
+        """
+        batch_cmd = f"; echo {BATCH_SEPARATOR}; ".join(cmds)
+        output = self.execute_cmd(cmd=batch_cmd, **kwargs)
+        if isinstance(output, tuple):
+            output = output[0]
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", errors="replace")
+        results = output.split(f"{BATCH_SEPARATOR}\n")
+        LOGGER.debug("Batch outputs: %s", results)
+        return results
+
     def path_exists(self, path: str) -> bool:
         """
         Check if file exists.
@@ -348,11 +370,12 @@ class Host(AbsHost):
         try:
             self.connect_pysftp()
             LOGGER.debug("sftp connected")
-            resp = self.pysftp_obj.put(local_path, remote_path)
+            # put() stats the remote file to confirm the upload, no extra probe needed
+            resp = self.pysftp_obj.put(local_path, remote_path, confirm=True)
             LOGGER.debug("file copied to : %s", str(remote_path))
             self.disconnect()
 
-            return self.path_exists(remote_path), resp
+            return True, resp
         except Exception as error:
             LOGGER.error(
                 "%s %s: %s", const.EXCEPTION_ERROR,
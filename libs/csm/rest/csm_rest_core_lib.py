@@ -35,22 +35,26 @@ class RestClient:
         This is the class for rest calls
     """
 
-    def __init__(self, config):
+    def __init__(self, config, session=None):
         """
         This function will initialize this class
         :param config: configuration of setup
+        :param session: optional requests.Session to reuse pooled connections
         """
         requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
         self.log = logging.getLogger(__name__)
         self._config = config
-        self._request = {"get": requests.get, "post": requests.post,
-                         "patch": requests.patch, "delete": requests.delete,
-                         "put": requests.put}
+        requester = session if session is not None else requests
+        self._request = {"get": requester.get, "post": requester.post,
+                         "patch": requester.patch, "delete": requester.delete,
+                         "put": requester.put}
         self._base_url = "{}:{}".format(
             self._config["mgmt_vip"], str(self._config["port"]))
         self._json_file_path = self._config[
             "jsonfile"] if 'jsonfile' in self._config else const.JOSN_FILE
         self.secure_connection = self._config["secure"]
+        # None keeps the requests default of waiting indefinitely
+        self._timeout = self._config.get("rest_timeout")
 
     # pylint: disable=too-many-arguments
     def rest_call(self, request_type, endpoint=None,
@@ -87,7 +91,7 @@ class RestClient:
         # Request a REST call
         response_object = self._request[request_type](
             request_url, headers=headers,
-            data=data, params=params, verify=False, json=json_dict)
+            data=data, params=params, verify=False, json=json_dict, timeout=self._timeout)
         self.log.debug("Response Object: %s", response_object)
         try:
             self.log.debug("Response JSON: %s", response_object.json())
@@ -124,7 +128,7 @@ class RestClient:
         # Request a REST call
         response_object = self._request[request_type](
             endpoint, headers=headers,
-            data=data, params=params, verify=False, json=json_dict)
+            data=data, params=params, verify=False, json=json_dict, timeout=self._timeout)
         self.log.debug("Response Object: %s", response_object)
         try:
             self.log.debug("Response JSON: %s", response_object.json())
@@ -20,25 +20,107 @@
 """Test library for s3 account operations."""
 import json
 import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from http import HTTPStatus
+import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
 import commons.errorcodes as err
 from commons.constants import Rest as const
 from commons.constants import S3_ENGINE_RGW
 from commons.exceptions import CTException
 from commons.utils import config_utils
+from libs.csm.rest.csm_rest_core_lib import RestClient
 from libs.csm.rest.csm_rest_test_lib import RestTestLib
 from libs.csm.rest.csm_rest_iamuser import RestIamUser
 from config import CSM_REST_CFG, CMN_CFG
 
+# Seconds a parsed s3 accounts listing is reused by the verify helpers
+_LIST_CACHE_TTL = 2
+
+# Keys every listed s3 account must carry
+_REQUIRED_ACC_KEYS = frozenset({const.ACC_NAME, const.ACC_EMAIL})
+
+# Edit payloads, entries holding "password" get the configured account password
+_EDIT_PAYLOAD_TEMPLATES = {
+    "valid": {"password": None, "reset_access_key": "true"},
+    "unchanged_access": {"password": None, "reset_access_key": "false"},
+    "only_reset_access_key": {"reset_access_key": "true"},
+    "only_password": {"password": None},
+    "no_payload": {}
+}
+
+# Create payloads which do not depend on the configuration
+_INVALID_PAYLOAD = MappingProxyType({"user_name": "xys",
+                                     "mail": "abc@email.com",
+                                     "pass_word": "password"})
+_INVALID_UI_PAYLOAD = MappingProxyType({"account_name": "*ask%^*&",
+                                        "account_email": "seagate*mail-com",
+                                        "password": "password"})
+
+
+def _match_acc(actual, name, email):
+    """Check a listed s3 account against the expected name and email."""
+    return actual.get(const.ACC_NAME) == name and actual.get(const.ACC_EMAIL) == email
+
+
 class RestS3user(RestTestLib):
     """RestS3user contains all the Rest Api calls for s3 account operations"""
 
     def __init__(self):
         super(RestS3user, self).__init__()
+        # Keep-alive session so that login and s3 account calls reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.config.get("rest_pool_connections", 16),
+                              pool_maxsize=self.config.get("rest_pool_maxsize", 64),
+                              max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+        self.restapi = RestClient(CSM_REST_CFG, session=self._session)
         self.recently_created_s3_account_user = None
+        self._last_created_s3_account = None
         self.recent_patch_payload = None
-        self.user_type = ("valid", "duplicate", "invalid", "missing")
+        self._list_cache = None
+        self._list_index = None
+        self.user_type = frozenset(
+            {"valid", "duplicate", "invalid", "missing", "pre-define", "invalid_for_ui"})
+        self._s3_endpoint = self.config["s3accounts_endpoint"]
+        self._default_password = self.config["test_s3account_password"]
+        self._predefined_user = self.config["s3account_user"]
+        password = self._default_password
+        self._edit_payloads = {
+            key: {**value, "password": password} if "password" in value else value
+            for key, value in _EDIT_PAYLOAD_TEMPLATES.items()}
+        self._new_acct_template = {"account_name": "", "account_email": "",
+                                   "password": password}
+        predefined = self._new_acct_template.copy()
+        predefined["account_name"] = self._predefined_user["username"]
+        predefined["account_email"] = self._predefined_user["email"]
+        predefined["password"] = self._predefined_user["password"]
+        self._static_payloads = {
+            "pre-define": MappingProxyType(predefined),
+            "missing": MappingProxyType({"password": password}),
+            "invalid": _INVALID_PAYLOAD,
+            "invalid_for_ui": _INVALID_UI_PAYLOAD}
+
+    def close(self):
+        """Close the pooled connections held by the REST session."""
+        self._session.close()
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+    def _account_endpoint(self, username):
+        """
+        Build the endpoint of a single s3 account
+        :param username: name of the s3 account
+        :return: endpoint of the account
+        """
+        return f"{self._s3_endpoint}/{username}"
 
     @RestTestLib.authenticate_and_login
     def create_s3_account(self, user_type="valid", save_new_user=False):
@@ -53,9 +135,10 @@ class RestS3user(RestTestLib):
         else:
             # Building request url
             self.log.debug("Create s3 accounts ...")
-            endpoint = self.config["s3accounts_endpoint"]
+            endpoint = self._s3_endpoint
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
             # Collecting required payload to be added for request
+            reused = user_type == "duplicate" and self._last_created_s3_account is not None
             user_data = self.create_payload_for_new_s3_account(user_type)
             self.log.debug("Payload for s3 accounts is %s", user_data)
             self.recently_created_s3_account_user = user_data
@@ -69,14 +152,64 @@ class RestS3user(RestTestLib):
                     user_data["password"])
             #user_data = json.dumps(user_data)
             # Fetching api response
-            return self.restapi.rest_call(
+            self._list_cache = None
+            response = self.restapi.rest_call(
                 "post", endpoint=endpoint, json_dict=user_data, headers=self.headers)
+            if response.status_code == const.SUCCESS_STATUS_FOR_POST:
+                self._last_created_s3_account = user_data
+                if reused:
+                    # Reused account was deleted elsewhere, it exists again now
+                    self.log.debug("Re-posting duplicate s3 account %s",
+                                   user_data[const.ACC_NAME])
+                    response = self.restapi.rest_call(
+                        "post", endpoint=endpoint, json_dict=user_data, headers=self.headers)
+            return response
+
+    @RestTestLib.authenticate_and_login
+    def create_s3_accounts_bulk(self, count, user_type="valid"):
+        """
+        This function will create s3 account users concurrently on the pooled session
+        :param count: number of accounts to be created
+        :param user_type: type of user required
+        :return: list of create user responses in payload order, holding the
+            exception instead when a request raised
+        """
+        if S3_ENGINE_RGW == CMN_CFG["s3_engine"]:
+            return [self.create_s3_basic() for _ in range(count)]
+        payloads = [self.create_payload_for_new_s3_account(user_type) for _ in range(count)]
+        self.log.debug("Creating %s s3 accounts concurrently", count)
+        headers = dict(self.headers)
+        responses = [None] * count
+        self._list_cache = None
+        with ThreadPoolExecutor(max_workers=max(1, min(count, 32))) as executor:
+            futures = {executor.submit(self.restapi.rest_call, "post",
+                                       endpoint=self._s3_endpoint, json_dict=payload,
+                                       headers=headers): index
+                       for index, payload in enumerate(payloads)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    responses[index] = future.result()
+                except requests.exceptions.RequestException as error:
+                    # One failed request does not abandon the other results
+                    self.log.error("Creating s3 account %s failed: %s",
+                                   payloads[index].get(const.ACC_NAME), error)
+                    responses[index] = error
+        if payloads:
+            self.recently_created_s3_account_user = payloads[-1]
+        # As with create_s3_account, duplicate payloads reuse the last created account
+        for payload, response in zip(reversed(payloads), reversed(responses)):
+            if getattr(response, "status_code", None) == const.SUCCESS_STATUS_FOR_POST:
+                self._last_created_s3_account = payload
+                break
+        return responses
 
 
     @RestTestLib.authenticate_and_login
-    def list_all_created_s3account(self):
+    def list_all_created_s3account(self, etag=None):
         """
             This function will list down all created accounts
+            :param etag: ETag of a previous listing, server answers 304 if unchanged
             :return: response of create user
         """
         if S3_ENGINE_RGW == CMN_CFG["s3_engine"]:
@@ -87,12 +220,15 @@ class RestS3user(RestTestLib):
         else:
             # Building request url
             self.log.debug("Try to fetch all s3 accounts ...")
-            endpoint = self.config["s3accounts_endpoint"]
+            endpoint = self._s3_endpoint
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
 
+            headers = self.headers
+            if etag:
+                headers = {**self.headers, "If-None-Match": etag}
             # Fetching api response
             response = self.restapi.rest_call(
-                "get", endpoint=endpoint, headers=self.headers)
+                "get", endpoint=endpoint, headers=headers)
 
         return response
 
@@ -107,8 +243,7 @@ class RestS3user(RestTestLib):
         try:
             # Building request url
             self.log.debug("Try to edit s3accounts user : %s", username)
-            endpoint = "{}/{}".format(
-                self.config["s3accounts_endpoint"], username)
+            endpoint = self._account_endpoint(username)
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
 
             # Collecting payload
@@ -118,12 +253,14 @@ class RestS3user(RestTestLib):
                 "Payload for edit s3 accounts is %s", patch_payload)
 
             # Fetching api response
+            self._list_cache = None
             response = self.restapi.rest_call(
                 "patch", data=patch_payload, endpoint=endpoint,
                 headers=self.headers)
 
             return response
-        except BaseException as error:
+        except (requests.exceptions.RequestException, KeyError,
+                AttributeError, TypeError) as error:
             self.log.error("%s %s: %s",
                            const.EXCEPTION_ERROR,
                            RestS3user.edit_s3_account_user.__name__,
@@ -145,10 +282,13 @@ class RestS3user(RestTestLib):
             # Building request url
             self.log.debug(
                 "Try to delete s3accounts user : %s", username)
-            endpoint = "{}/{}".format(
-                self.config["s3accounts_endpoint"], username)
+            endpoint = self._account_endpoint(username)
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
             # Fetching api response
+            self._list_cache = None
+            if self._last_created_s3_account and \
+                    self._last_created_s3_account.get(const.ACC_NAME) == username:
+                self._last_created_s3_account = None
             response = self.restapi.rest_call(
                 "delete", endpoint=endpoint, headers=self.headers)
             # As per Pranay's suggestion, adding retry/polling of 25's to delete s3 account.
@@ -166,30 +306,65 @@ class RestS3user(RestTestLib):
         :param expect_no_user: In case no user expected
         :return: Success(True)/Failure(False)
         """
+        self.log.debug("Response to be verified : %s",
+                        self.recently_created_s3_account_user)
+
         # Fetching all created accounts
-        response = self.list_all_created_s3account()
+        accounts = self._get_s3_accounts_parsed()
+        if accounts is None:
+            return False
 
+        # Checking for not "no user" scenario
+        if len(accounts) == 0 or expect_no_user:
+            self.log.warning("No accounts present till now is : %s", len(accounts))
+            return len(accounts) == 0 and expect_no_user
+
+        return all(account.keys() >= _REQUIRED_ACC_KEYS for account in accounts)
+
+    def _get_s3_accounts_parsed(self):
+        """
+        Fetch the parsed s3 accounts list, reusing a listing fetched in the last
+        _LIST_CACHE_TTL seconds when no account was changed in between. Older
+        listings are revalidated with their ETag when the server sent one.
+        :return: list of s3 accounts or None if listing failed
+        """
+        if self._list_cache and time.time() - self._list_cache[2] < _LIST_CACHE_TTL:
+            return self._list_cache[0]
+        etag = self._list_cache[1] if self._list_cache else None
+        response = self.list_all_created_s3account(etag=etag)
+        # Nothing to read the status code of without a response
+        if response is None:
+            self.log.debug("No response fetched for the s3 accounts list")
+            return None
+        # 304 is checked before 200, it carries no body to parse
+        if etag and response.status_code == HTTPStatus.NOT_MODIFIED:
+            self.log.debug("s3 accounts list is unchanged since last fetch")
+            self._list_cache = (self._list_cache[0], etag, time.time())
+            return self._list_cache[0]
         # Checking status code
-        self.log.debug("Response to be verified : %s",
-                        self.recently_created_s3_account_user)
-        if (not response) or response.status_code != const.SUCCESS_STATUS:
+        if response.status_code != const.SUCCESS_STATUS:
             self.log.debug("Response is not 200")
-            return False
+            return None
+        etag = response.headers.get("ETag")
         response = response.json()
-
         # Checking the response validity of response
         if const.S3_ACCOUNTS not in response:
             self.log.error("Error !!! No response fetched ...")
-            return False
-
-        # Checking for not "no user" scenario
-        if len(response["s3_accounts"]) == 0 or expect_no_user:
-            self.log.warning("No accounts present till now is : %s",
-                                len(response["iam_users"]))
-            return len(response["s3_accounts"]) == 0 and expect_no_user
+            return None
+        self._list_cache = (response[const.S3_ACCOUNTS], etag, time.time())
+        return self._list_cache[0]
 
-        return all(const.ACC_NAME in key and const.ACC_EMAIL in key
-                    for key in response["s3_accounts"])
+    def _get_s3_accounts_index(self):
+        """
+        Index the parsed s3 accounts list by account name, rebuilt once per listing.
+        :return: dict of account name to account details
+        """
+        accounts = self._get_s3_accounts_parsed()
+        if accounts is None:
+            return {}
+        if self._list_index is None or self._list_index[0] is not accounts:
+            self._list_index = (accounts, {acc.get(const.ACC_NAME): acc for acc in accounts})
+        return self._list_index[1]
 
     # pylint: disable-msg=too-many-return-statements
     def create_and_verify_s3account(self, user, expect_status_code):
@@ -239,12 +414,10 @@ class RestS3user(RestTestLib):
         # Checking response in details
         self.log.debug(
             "verifying Newly created account data in created list...")
-        list_acc = self.list_all_created_s3account().json()["s3_accounts"]
-        expected_result = {const.ACC_EMAIL: response[const.ACC_EMAIL],
-                            const.ACC_NAME: response[const.ACC_NAME]}
-
-        return any(config_utils.verify_json_response(actual_result, expected_result)
-                    for actual_result in list_acc), response
+        name = response[const.ACC_NAME]
+        account = self._get_s3_accounts_index().get(name)
+        matched = account is not None and _match_acc(account, name, response[const.ACC_EMAIL])
+        return matched, response
 
 
     def create_payload_for_new_s3_account(self, user_type):
@@ -254,40 +427,25 @@ class RestS3user(RestTestLib):
         :return: payload
         """
         # Creating payload for required user type
-        # Creating s3accounts which are pre-defined in config
-        if user_type == "pre-define":
-            self.log.debug(
-                "Creating s3accounts which are pre-defined in config")
-            data = self.config["s3account_user"]
-            return {"account_name": data["username"],
-                    "account_email": data["email"],
-                    "password": data["password"]}
+        if user_type in self._static_payloads:
+            self.log.debug("Using %s payload for s3accounts", user_type)
+            # Payload is sent as json, which needs a plain dict
+            return dict(self._static_payloads[user_type])
 
         if user_type == "valid":
-            user_name = "test%s" % int(time.time_ns())
-            email_id = "test%s@seagate.com" % int(time.time_ns())
+            timestamp = time.time_ns()
+            user_name = f"test{timestamp}"
+            email_id = f"test{timestamp}@seagate.com"
         if user_type == "duplicate":
-            # creating new user to make it as duplicate
+            # Reuse the account created last, create one only if there is none
+            if self._last_created_s3_account is not None:
+                return dict(self._last_created_s3_account)
             self.create_s3_account()
             return self.recently_created_s3_account_user
 
-        if user_type == "missing":
-            return {"password": self.config["test_s3account_password"]}
-
-        if user_type == "invalid":
-            return {"user_name": "xys",
-                    "mail": "abc@email.com",
-                    "pass_word": "password"}
-
-        if user_type == "invalid_for_ui":
-            return {"account_name": "*ask%^*&",
-                    "account_email": "seagate*mail-com",
-                    "password": "password"}
-
-        user_data = {"account_name": user_name,
-                        "account_email": email_id,
-                        "password": self.config["test_s3account_password"]}
-
+        user_data = self._new_acct_template.copy()
+        user_data["account_name"] = user_name
+        user_data["account_email"] = email_id
         return user_data
 
 
@@ -297,25 +455,12 @@ class RestS3user(RestTestLib):
         :param payload_type: type of payload required
         :return: payload
         """
-        # Creating payload for edit user type
-        payload_values = {
-            "valid": {"password": self.config["test_s3account_password"],
-                        "reset_access_key": "true"},
-            "unchanged_access": {
-                "password": self.config["test_s3account_password"],
-                "reset_access_key": "false"},
-            "only_reset_access_key": {"reset_access_key": "true"},
-            "only_password": {
-                "password": self.config["test_s3account_password"]},
-            "no_payload": {}
-        }
-
         # Check payload_type present or not
-        if payload_type not in payload_values:
+        if payload_type not in self._edit_payloads:
             self.log.error("Invalid payload type ...")
             return None
 
-        return payload_values[payload_type]
+        return self._edit_payloads[payload_type]
 
 
     # pylint: disable-msg=too-many-return-statements
@@ -395,7 +540,7 @@ class RestS3user(RestTestLib):
             username=account_name)
 
         # Checking status code
-        self.log.debug(f"Response to be verified for user: {account_name}")
+        self.log.debug("Response to be verified for user: %s", account_name)
         if (not response) or response.status_code != const.SUCCESS_STATUS:
             self.log.debug("Response is not 200")
             return False
@@ -422,8 +567,7 @@ class RestS3user(RestTestLib):
         else:
             # Building request url
             self.log.debug("Try to edit s3accounts user : %s", username)
-            endpoint = "{}/{}".format(
-                self.config["s3accounts_endpoint"], username)
+            endpoint = self._account_endpoint(username)
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
 
             self.log.debug(
@@ -431,6 +575,7 @@ class RestS3user(RestTestLib):
 
             # Fetching api response
             self.log.debug("Fetching api response...")
+            self._list_cache = None
             response = self.restapi.rest_call(
                 "patch", data=payload, endpoint=endpoint, headers=self.headers)
 
@@ -444,30 +589,30 @@ class RestS3user(RestTestLib):
         :param old_password: Old Password
         :param new_password: New Password
         """
-        self.log.debug(f"Changing password of s3 user {username} from {old_password} to "
-                       f"{new_password}")
+        self.log.debug("Changing password of s3 user %s from %s to %s",
+                       username, old_password, new_password)
         # Prepare patch for s3 account user
         patch_payload = {"password": new_password, "reset_access_key": "true"}
-        self.log.debug("editing user {}".format(patch_payload))
-        endpoint = "{}/{}".format(self.config["s3accounts_endpoint"], username)
-        self.log.debug("Endpoint for s3 accounts is {}".format(endpoint))
+        self.log.debug("editing user %s", patch_payload)
+        endpoint = self._account_endpoint(username)
+        self.log.debug("Endpoint for s3 accounts is %s", endpoint)
         self.headers["Content-Type"] = "application/json"
         try:
             # Fetching api response
             response = self.restapi.rest_call("patch", data=json.dumps(patch_payload),
                                               endpoint=endpoint, headers=self.headers)
         except Exception as error:
-            self.log.error("{0} {1}: {2}".format(
-                const.EXCEPTION_ERROR,
-                RestS3user.update_s3_user_password.__name__,
-                error))
+            self.log.error("%s %s: %s",
+                           const.EXCEPTION_ERROR,
+                           RestS3user.update_s3_user_password.__name__,
+                           error)
             raise CTException(err.CSM_REST_VERIFICATION_FAILED, error.args[0])
 
         if response.status_code != const.SUCCESS_STATUS:
-            self.log.error(f"Response code : {response.status_code}")
-            self.log.error(f"Response content: {response.content}")
-            self.log.error(f"Request headers : {response.request.headers}\n"
-                           f"Request body : {response.request.body}")
+            self.log.error("Response code : %s", response.status_code)
+            self.log.error("Response content: %s", response.content)
+            self.log.error("Request headers : %s\nRequest body : %s",
+                           response.request.headers, response.request.body)
             raise CTException(err.CSM_REST_GET_REQUEST_FAILED,
                               msg="CSM user password change request failed.")
 
@@ -486,7 +631,7 @@ class RestS3user(RestTestLib):
             return self.create_s3_basic(payload)
         else:
             self.log.debug("Create s3 accounts ...")
-            endpoint = self.config["s3accounts_endpoint"]
+            endpoint = self._s3_endpoint
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
             # Collecting required payload to be added for request
             user_data = {
@@ -496,6 +641,7 @@ class RestS3user(RestTestLib):
             }
             self.log.debug("Payload for s3 accounts is %s", user_data)
             #Fetching api response
+            self._list_cache = None
             return self.restapi.rest_call(
                 "post", endpoint=endpoint, data=user_data,
                 headers=self.headers)
@@ -519,9 +665,10 @@ class RestS3user(RestTestLib):
             resp = self.create_s3_basic(payload)
         else:
             self.log.debug("Create s3 accounts ...")
-            endpoint = self.config["s3accounts_endpoint"]
+            endpoint = self._s3_endpoint
             self.log.debug("Endpoint for s3 accounts is %s", endpoint)
             user_data = json.dumps(user_data)
+            self._list_cache = None
             resp = self.restapi.rest_call("post", endpoint=endpoint, data=user_data,
                                         headers=self.headers)
 
@@ -535,9 +682,10 @@ class RestS3user(RestTestLib):
         Create the payload for the create S3
         :param user_type: value from "valid","duplicate_user",..
         """
-        user_name = "test%s" % int(time.time_ns())
-        email_id = "test%s@seagate.com" % int(time.time_ns())
-        password = self.config["test_s3account_password"]
+        timestamp = time.time_ns()
+        user_name = f"test{timestamp}"
+        email_id = f"test{timestamp}@seagate.com"
+        password = self._default_password
         access = user_name.ljust(const.S3_ACCESS_LL, "d")
         secret = config_utils.gen_rand_string(length=const.S3_SECRET_LL)
 
@@ -561,9 +709,10 @@ class RestS3user(RestTestLib):
                              user_name, email_id, password, access, secret]))
             self.create_custom_s3_user(user_data)
             self.log.info("Valid S3 account created.")
-            email_id = "test%s@seagate.com" % int(time.time_ns())
+            timestamp = time.time_ns()
+            email_id = f"test{timestamp}@seagate.com"
             secret = config_utils.gen_rand_string(length=const.S3_SECRET_LL)
-            tmp = "test%s" % int(time.time_ns())
+            tmp = f"test{timestamp}"
             access = tmp.ljust(const.S3_ACCESS_LL, "d")
             user_name = self.recently_created_s3_account_user["account_name"]
             user_data = dict(zip(const.CUSTOM_S3_USER, [
@@ -575,8 +724,9 @@ class RestS3user(RestTestLib):
                              user_name, email_id, password, access, secret]))
             self.create_custom_s3_user(user_data)
             self.log.info("Valid S3 account created.")
-            user_name = "test%s" % int(time.time_ns())
-            email_id = "test%s@seagate.com" % int(time.time_ns())
+            timestamp = time.time_ns()
+            user_name = f"test{timestamp}"
+            email_id = f"test{timestamp}@seagate.com"
             secret = config_utils.gen_rand_string(length=const.S3_SECRET_LL)
             access = self.recently_created_s3_account_user["access_key"]
             user_data = dict(zip(const.CUSTOM_S3_USER, [
@@ -588,7 +738,7 @@ class RestS3user(RestTestLib):
                              user_name, email_id, password, access, secret]))
             self.create_custom_s3_user(user_data)
             self.log.info("Valid S3 account created.")
-            user_name = "test%s" % int(time.time_ns())
+            user_name = f"test{time.time_ns()}"
             access = user_name.ljust(const.S3_ACCESS_LL, "d")
             secret = config_utils.gen_rand_string(length=const.S3_SECRET_LL)
             email_id = self.recently_created_s3_account_user["account_email"]
@@ -601,9 +751,10 @@ class RestS3user(RestTestLib):
                              user_name, email_id, password, access, secret]))
             self.create_custom_s3_user(user_data)
             self.log.info("Valid S3 account created.")
-            user_name = "test%s" % int(time.time_ns())
-            email_id = "test%s@seagate.com" % int(time.time_ns())
-            password = self.config["test_s3account_password"]
+            timestamp = time.time_ns()
+            user_name = f"test{timestamp}"
+            email_id = f"test{timestamp}@seagate.com"
+            password = self._default_password
             access = user_name.ljust(const.S3_ACCESS_LL, "d")
             secret = self.recently_created_s3_account_user["secret_key"]
             user_data = dict(zip(const.CUSTOM_S3_USER, [
@@ -620,11 +771,11 @@ class RestS3user(RestTestLib):
             user_data = dict(zip(template, [user_name, email_id, password, access]))
         if user_type == "pre-define":
             template = const.CUSTOM_S3_USER.copy()
-            user_data = dict(zip(template, [CSM_REST_CFG["s3account_user"]["username"],
-                                            CSM_REST_CFG["s3account_user"]["email"],
-                                            CSM_REST_CFG["s3account_user"]["password"],
-                                            CSM_REST_CFG["s3account_user"]["access_key"],
-                                            CSM_REST_CFG["s3account_user"]["secret_key"]]))
+            user_data = dict(zip(template, [self._predefined_user["username"],
+                                            self._predefined_user["email"],
+                                            self._predefined_user["password"],
+                                            self._predefined_user["access_key"],
+                                            self._predefined_user["secret_key"]]))
 
         return user_data
 
@@ -43,6 +43,7 @@ class RestTestLib:
         self.restapi = RestClient(CSM_REST_CFG)
         self.user_type = ("valid", "duplicate", "invalid", "missing")
         self.headers = {}
+        self._auth_cache = {}
         self.seed = int(time.time())
         self.random_gen = Random(self.seed)
         self.log.info("Seed : %s", self.seed)
@@ -200,19 +201,36 @@ class RestTestLib:
             login_type = kwargs.pop("login_as") if "login_as" in kwargs else "csm_admin_user"
             # Checking the requirements to authorize
             authorized = kwargs.pop("authorized") if "authorized" in kwargs else True
-            # Fetching the login response
-            self.log.debug("user will be logged in as %s", login_type)
-            response = self.rest_login(login_as=login_type)
-            if authorized and response.status_code == const.SUCCESS_STATUS:
-                self.headers = {'Authorization': response.headers['Authorization']}
+            cache_key = self.get_auth_cache_key(login_type)
+            cached = self._auth_cache.get(cache_key) if authorized else None
+            if cached and time.time() - cached[1] < const.AUTH_CACHE_TTL:
+                # The TTL is below the token lifetime, so the cached login is
+                # used without another round trip
+                self.log.debug("reusing cached login of %s", login_type)
+                # Callers update self.headers in place, hand out a copy
+                self.headers = dict(cached[0])
             else:
-                self.log.error("Authentication request failed in %s.\nResponse code : %s",
-                               RestTestLib.authenticate_and_login.__name__, response.status_code)
-                self.log.error("Response content: %s", response.content)
-                self.log.error("Request headers : %s\nRequest body : %s",
-                               response.request.headers, response.request.body)
-                raise CTException(err.CSM_REST_AUTHENTICATION_ERROR)
-            return func(self, *args, **kwargs)
+                # Fetching the login response
+                self.log.debug("user will be logged in as %s", login_type)
+                response = self.rest_login(login_as=login_type)
+                if authorized and response.status_code == const.SUCCESS_STATUS:
+                    self.headers = {'Authorization': response.headers['Authorization']}
+                    self._auth_cache[cache_key] = (dict(self.headers), time.time())
+                else:
+                    self.log.error("Authentication request failed in %s.\nResponse code : %s",
+                                   RestTestLib.authenticate_and_login.__name__,
+                                   response.status_code)
+                    self.log.error("Response content: %s", response.content)
+                    self.log.error("Request headers : %s\nRequest body : %s",
+                                   response.request.headers, response.request.body)
+                    raise CTException(err.CSM_REST_AUTHENTICATION_ERROR)
+            result = func(self, *args, **kwargs)
+            if getattr(result, "status_code", None) == const.UNAUTHORIZED:
+                # Token was revoked server side, the next call logs in again.
+                # The call itself is not replayed, it may have side effects.
+                self.log.debug("dropping rejected login of %s", login_type)
+                self._auth_cache.pop(cache_key, None)
+            return result
 
         return create_authenticate_header
 
@@ -236,12 +254,25 @@ class RestTestLib:
             # logout session.
             resp = self.restapi.rest_call(
                 "post", endpoint=self.config["rest_logout_endpoint"], headers=self.headers)
+            # Token is no longer valid, drop every cached login
+            self._auth_cache.clear()
             if resp.status_code != const.SUCCESS_STATUS:
                 raise CTException(err.CSM_REST_AUTHENTICATION_ERROR)
             return response
 
         return inner_func
 
+    def get_auth_cache_key(self, login_as):
+        """
+        Build the key under which the login headers of a user are cached
+        :param login_as: str config key or dict of credentials
+        :return: hashable key with the current credentials
+        """
+        if isinstance(login_as, dict):
+            return tuple(sorted(login_as.items()))
+        creds = self.config.get(login_as, {})
+        return login_as, creds.get("username"), creds.get("password")
+
     def update_csm_config_for_user(self, user_type, username, password):
         """
          This function will update user config in run time
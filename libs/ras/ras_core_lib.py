@@ -23,7 +23,10 @@ import ast
 import json
 import logging
 import os
+import re
+import shlex
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Any, Union, List
 
 from commons import commands as common_commands
@@ -38,6 +41,28 @@ from libs.s3 import S3H_OBJ
 
 LOGGER = logging.getLogger(__name__)
 
+# Consul commands with the binary path resolved once at import
+_KV_PUT_TMPL = f"{cmn_cons.CONSUL_PATH} kv put {{kv_path}}/{{field}} {{val}}"
+_KV_GET_TMPL = f"{cmn_cons.CONSUL_PATH} kv get {{kv_path}}/{{field}}"
+
+# First node listed on the Masters/Slaves lines of the sspl pcs section
+_PCS_MASTERS_RE = re.compile(r"Masters:\s*\[\s*(\S+)")
+_PCS_SLAVES_RE = re.compile(r"Slaves:\s*\[\s*(\S+)")
+
+
+def _encrypted_token(output: bytes) -> str:
+    """
+    Extract the encrypted value from encryptor.py output, which prints the
+    token as a bytes literal (b'...') in its last field.
+
+    :param output: raw console output of the encrypt command
+    :return: encrypted token without the bytes literal wrapper
+    """
+    token = output.rsplit(None, 1)[-1]
+    if token[:2] in (b"b'", b'b"') and token[-1:] == token[1:2]:
+        token = token[2:-1]
+    return token.decode("utf-8")
+
 
 class RASCoreLib:
     """A class including functions for ras component related operations."""
@@ -64,6 +89,8 @@ class RASCoreLib:
             enclosure_pwd=CMN_CFG["enclosure"]["enclosure_pwd"])
 
         self.s3obj = S3H_OBJ
+        self._screen_installed = None
+        self._cluster_id = None
 
     def create_remote_dir_recursive(self, file_path: str) -> bool:
         """
@@ -74,18 +101,16 @@ class RASCoreLib:
         :return: Boolean status
         :rtype: bool
         """
-        new_path = "/"
         res = self.node_utils.path_exists(path=file_path)
-        if not res:
-            remote_path_lst = file_path.split("/")[:-1]
-            for directory in remote_path_lst[1:]:
-                old_path = new_path
-                new_path = os.path.join(new_path, directory)
-                if not self.node_utils.path_exists(new_path):
-                    resp = self.node_utils.create_dir_sftp(
-                        dpath=os.path.join(directory, old_path))
-                    if not resp:
-                        return False
+        parent_dir = os.path.dirname(file_path)
+        if not res and parent_dir:
+            # Single round trip instead of a probe and mkdir per path component
+            try:
+                self.node_utils.execute_cmd(
+                    cmd=common_commands.CMD_MKDIR.format(shlex.quote(parent_dir)))
+            except IOError as error:
+                LOGGER.error("Failed to create %s: %s", parent_dir, error)
+                return False
 
         return True
 
@@ -98,8 +123,7 @@ class RASCoreLib:
         :return: response in tuple
         """
         reset_file_cmd = common_commands.EMPTY_FILE_CMD.format(file_path)
-        res = self.node_utils.execute_cmd(
-            cmd=reset_file_cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        res = self.node_utils.execute_cmd(cmd=reset_file_cmd)
         return res
 
     def cp_file(self, path: str, backup_path: str) -> \
@@ -112,8 +136,7 @@ class RASCoreLib:
         :return: response in tuple
         """
         cmd = common_commands.COPY_FILE_CMD.format(path, backup_path)
-        resp = self.node_utils.execute_cmd(cmd=cmd,
-                                           read_nbytes=cmn_cons.BYTES_TO_READ)
+        resp = self.node_utils.execute_cmd(cmd=cmd)
         return True, resp
 
     def install_screen_on_machine(self) -> Tuple[Union[List[str], str, bytes]]:
@@ -125,10 +148,19 @@ class RASCoreLib:
         LOGGER.info("Installing screen utility")
         cmd = common_commands.INSTALL_SCREEN_CMD
         LOGGER.info("Running command %s", cmd)
-        response = self.node_utils.execute_cmd(
-            cmd=cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        response = self.node_utils.execute_cmd(cmd=cmd)
         return response
 
+    def _probe_output(self, cmd: str) -> bytes:
+        """
+        Run a probe command whose non-zero exit status is an expected answer.
+
+        :param cmd: command to be executed
+        :return: stdout of the command
+        """
+        resp = self.node_utils.execute_cmd(cmd=cmd, exc=False)
+        return resp[0] if isinstance(resp, tuple) else resp
+
     def run_cmd_on_screen(self, cmd: str) -> \
             Tuple[bool, Union[List[str], str, bytes]]:
         """
@@ -137,13 +169,23 @@ class RASCoreLib:
         :param cmd: command to be executed on screen
         :return: screen response
         """
-        self.install_screen_on_machine()
-        time.sleep(5)
+        if self._screen_installed is None:
+            self._screen_installed = bool(
+                self._probe_output(common_commands.CHECK_SCREEN_CMD).strip())
+        if not self._screen_installed:
+            self.install_screen_on_machine()
+            self._screen_installed = True
         LOGGER.debug("Command to be run: %s", cmd)
         screen_cmd = common_commands.SCREEN_CMD.format(cmd)
         LOGGER.info("Running command %s", screen_cmd)
-        response = self.node_utils.execute_cmd(
-            cmd=screen_cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        response = self.node_utils.execute_cmd(cmd=screen_cmd)
+        # Wait until the detached screen session is listed, at most ~6 seconds
+        delay = 0.2
+        for _ in range(5):
+            if self._probe_output(common_commands.SCREEN_SESSION_CHECK_CMD).strip():
+                break
+            time.sleep(delay)
+            delay *= 2
         return True, response
 
     def start_rabbitmq_reader_cmd(self, sspl_exchange: str, sspl_key: str,
@@ -214,8 +256,7 @@ class RASCoreLib:
         stat_cmd = common_commands.UPDATE_STAT_FILE_CMD.format(
             cmn_cons.SERVICE_STATUS_PATH)
         LOGGER.debug("Running cmd: %s on host: %s", stat_cmd, self.host)
-        response = self.node_utils.execute_cmd(
-            cmd=stat_cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        response = self.node_utils.execute_cmd(cmd=stat_cmd)
 
         return True, response
 
@@ -229,8 +270,7 @@ class RASCoreLib:
         """
         cmd = common_commands.FILE_MODE_CHANGE_CMD.format(path)
         LOGGER.debug("Executing cmd : %s on %s node.", cmd, self.host)
-        res = self.node_utils.execute_cmd(cmd=cmd,
-                                          read_nbytes=cmn_cons.BYTES_TO_READ)
+        res = self.node_utils.execute_cmd(cmd=cmd)
         return res
 
     def get_cluster_id(self) -> Tuple[bool, Union[List[str], str, bytes]]:
@@ -241,10 +281,22 @@ class RASCoreLib:
         """
         cmd = common_commands.GET_CLUSTER_ID_CMD
         LOGGER.debug("Running cmd: %s on host: %s", cmd, self.host)
-        cluster_id = self.node_utils.execute_cmd(
-            cmd=cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        cluster_id = self.node_utils.execute_cmd(cmd=cmd)
         return True, cluster_id
 
+    @property
+    def cluster_id(self) -> str:
+        """
+        Cluster ID parsed from get_cluster_id, fetched once per instance as it
+        does not change for the lifetime of the cluster.
+
+        :return: cluster id
+        """
+        if self._cluster_id is None:
+            cluster_id = self.get_cluster_id()[1].decode("utf-8")
+            self._cluster_id = cluster_id.rsplit(None, 1)[-1]
+        return self._cluster_id
+
     def encrypt_pwd(self, password: str, cluster_id: str) -> \
             Tuple[bool, Union[List[str], str, bytes]]:
         """
@@ -256,8 +308,7 @@ class RASCoreLib:
         """
         cmd = common_commands.ENCRYPT_PASSWORD_CMD.format(password, cluster_id)
         LOGGER.debug("Running cmd: %s on host: %s", cmd, self.host)
-        res = self.node_utils.execute_cmd(cmd=cmd,
-                                          read_nbytes=cmn_cons.BYTES_TO_READ)
+        res = self.node_utils.execute_cmd(cmd=cmd)
         return True, res
 
     def kv_put(self, field: str, val: str, kv_path: str) -> \
@@ -271,9 +322,9 @@ class RASCoreLib:
         :return: response in tupple
         """
         LOGGER.info("Putting value %s of %s from %s", val, field, kv_path)
-        put_cmd = f"{cmn_cons.CONSUL_PATH} kv put {kv_path}/{field} {val}"
+        put_cmd = _KV_PUT_TMPL.format(kv_path=kv_path, field=field, val=val)
         LOGGER.info("Running command: %s", put_cmd)
-        resp = self.node_utils.execute_cmd(cmd=put_cmd, read_nbytes=cmn_cons.ONE_BYTE_TO_READ)
+        resp = self.node_utils.execute_cmd(cmd=put_cmd)
         return True, resp
 
     def kv_get(self, field: str, kv_path: str) -> \
@@ -285,10 +336,9 @@ class RASCoreLib:
         :param kv_path: path to the KV store for consul
         :return:
         """
-        get_cmd = f"{cmn_cons.CONSUL_PATH} kv get {kv_path}/{field}"
+        get_cmd = _KV_GET_TMPL.format(kv_path=kv_path, field=field)
         LOGGER.info("Running command: %s", get_cmd)
-        response = self.node_utils.execute_cmd(
-            cmd=get_cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        response = self.node_utils.execute_cmd(cmd=get_cmd)
         return True, response
 
     # pylint: disable=too-many-statements
@@ -314,23 +364,17 @@ class RASCoreLib:
             elif field in ("password", "secret"):
                 password = pwd
 
-                self.node_utils.copy_file_to_remote(local_path=local_path,
-                                                    remote_path=path)
-                if not self.node_utils.path_exists(path=path):
+                copied, _ = self.node_utils.copy_file_to_remote(local_path=local_path,
+                                                                remote_path=path)
+                if not copied:
                     LOGGER.debug('Failed to copy the file')
                     return False
                 self.change_file_mode(path=path)
                 LOGGER.info("Getting cluster id")
-                cluster_id = self.get_cluster_id()
-                cluster_id = cluster_id[1].decode("utf-8")
-                cluster_id = " ".join(cluster_id.split())
-                cluster_id = cluster_id.split(' ')[-1]
+                cluster_id = self.cluster_id
 
                 LOGGER.info("Encrypting the password")
-                val = self.encrypt_pwd(password, cluster_id)
-                val = val[1].split()[-1]
-                val = val.decode("utf-8")
-                val = (repr(val)[2:-1]).replace('\'', '')
+                val = _encrypted_token(self.encrypt_pwd(password, cluster_id)[1])
             else:
                 LOGGER.info(
                     "Getting value of %s from storage_enclosure.sls", field)
@@ -343,9 +387,10 @@ class RASCoreLib:
                     return False
 
                 str_f = field.split('_')[-1]
-                cmd = f"sed '/{str_f}:/!d' {cmn_cons.STORAGE_ENCLOSURE_PATH} | sed '{lin}d' | " \
-                      f"awk '{{print $2}}'"
-                val = self.node_utils.execute_cmd(cmd=cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+                # Matching lines except the lin-th one, second field only
+                cmd = f"awk '/{str_f}:/ && ++c != {lin} {{print $2}}' " \
+                      f"{cmn_cons.STORAGE_ENCLOSURE_PATH}"
+                val = self.node_utils.execute_cmd(cmd=cmd)
                 val = val.decode("utf-8")
                 val = " ".join(val.split())
 
@@ -353,17 +398,13 @@ class RASCoreLib:
                 "Putting value %s of %s from storage_enclosure.sls",
                 val,
                 field)
-            if field == "secret":
-                self.kv_put(cmn_cons.SECRET_KEY, val, cmn_cons.KV_STORE_PATH)
-            else:
-                self.kv_put(field, val, cmn_cons.KV_STORE_PATH)
-            LOGGER.info("Validating the value")
-            if field == "secret":
-                response = self.kv_get(cmn_cons.SECRET_KEY,
-                                       cmn_cons.KV_STORE_PATH)
-            else:
-                response = self.kv_get(field, cmn_cons.KV_STORE_PATH)
-            response = response[1].decode("utf-8")
+            key = cmn_cons.SECRET_KEY if field == "secret" else field
+            kv_path = cmn_cons.KV_STORE_PATH
+            # Put and read back the value in one remote shell
+            LOGGER.info("Putting and validating the value")
+            response = self.node_utils.execute_batch(
+                [_KV_PUT_TMPL.format(kv_path=kv_path, field=key, val=val),
+                 _KV_GET_TMPL.format(kv_path=kv_path, field=key)])[-1]
             response = " ".join(response.split())
             if val == response:
                 LOGGER.debug("Successfully written data for %s", field)
@@ -423,8 +464,7 @@ class RASCoreLib:
         arguments = " ".join(args)
         mdadm_cmd = common_commands.MDADM_CMD.format(arguments)
         LOGGER.info("Executing %s cmd on host %s", mdadm_cmd, self.host)
-        output = self.node_utils.execute_cmd(
-            cmd=mdadm_cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        output = self.node_utils.execute_cmd(cmd=mdadm_cmd)
         return output
 
     def get_sspl_state(self) -> Tuple[bool, str]:
@@ -436,10 +476,9 @@ class RASCoreLib:
         """
         flag = False
         sspl_state_cmd = cmn_cons.SSPL_STATE_CMD
-        response = self.node_utils.execute_cmd(
-            cmd=sspl_state_cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+        response = self.node_utils.execute_cmd(cmd=sspl_state_cmd)
         response = response.decode("utf-8")
-        response = response.strip().split("=")[-1]
+        response = response.rpartition("=")[2].strip()
         LOGGER.debug("SSPL state resp : %s", response)
         if response == "active":
             flag = True
@@ -457,9 +496,10 @@ class RASCoreLib:
         pcs_status = self.node_utils.execute_cmd(
             cmd=pcs_status_cmd, read_lines=True)
         sspl_section = pcs_status.index(cmn_cons.PCS_SSPL_SECTION)
-        masters = pcs_status[sspl_section + 1].strip()[11:20]
-        slaves = pcs_status[sspl_section + 2].strip()[10:19]
-        state = {'masters': masters, 'slaves': slaves}
+        masters = _PCS_MASTERS_RE.search(pcs_status[sspl_section + 1])
+        slaves = _PCS_SLAVES_RE.search(pcs_status[sspl_section + 2])
+        state = {'masters': masters.group(1) if masters else '',
+                 'slaves': slaves.group(1) if slaves else ''}
 
         return state
 
@@ -473,8 +513,11 @@ class RASCoreLib:
         sel_info_cmd = common_commands.SEL_INFO_CMD
         res = self.node_utils.execute_cmd(sel_info_cmd)
         alert_cache_data = res.decode("utf-8").split('\n')
-        use_percent_lst = [k for k in alert_cache_data if "Percent Used" in k]
-        percent_use = use_percent_lst[0].split(":")[-1].strip().rstrip("%")
+        percent_line = next((k for k in alert_cache_data if "Percent Used" in k), None)
+        if percent_line is None:
+            LOGGER.warning("Percent Used not reported by %s", sel_info_cmd)
+            return 0
+        percent_use = percent_line.rsplit(":", 1)[-1].strip().rstrip("%")
 
         return int(percent_use)
 
@@ -501,8 +544,8 @@ class RASCoreLib:
         ipmi_tool_lst_cmd = common_commands.IPMI_SDR_LIST_CMD
         componets_lst = self.node_utils.execute_cmd(ipmi_tool_lst_cmd)
         componets_lst = componets_lst.decode("utf-8").split('\n')
-        fan_list = [i for i in componets_lst if "FAN" in i]
-        return fan_list[0].split("|")[0].strip()
+        fan = next((i for i in componets_lst if "FAN" in i), None)
+        return fan.split("|")[0].strip() if fan is not None else None
 
     @staticmethod
     def validate_exec_time(time_str: str) -> Tuple[bool, Any]:
@@ -530,7 +573,28 @@ class RASCoreLib:
         """
         LOGGER.info("Service to be restarted is: %s", service_name)
         resp = self.health_obj.restart_pcs_resource(service_name)
-        time.sleep(60)
+        self._wait_pcs_status(service_name, running=True, deadline=60)
+        return resp
+
+    def _wait_pcs_status(self, service: str, running: bool, deadline: int) \
+            -> Tuple[bool, str]:
+        """
+        Poll pcs resource status with backoff until it reaches the expected state.
+
+        :param service: pcs resource to be checked
+        :param running: True to wait for started, False to wait for stopped
+        :param deadline: maximum seconds to wait
+        :return: last pcs_service_status response
+        """
+        start = time.monotonic()
+        delay = 0.5
+        resp = self.health_obj.pcs_service_status(service)
+        while resp[0] != running and time.monotonic() - start < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 5)
+            resp = self.health_obj.pcs_service_status(service)
+        LOGGER.debug("%s status after %.1f seconds: %s", service,
+                     time.monotonic() - start, resp[0])
         return resp
 
     def enable_disable_service(self, operation: str = None,
@@ -545,8 +609,7 @@ class RASCoreLib:
         command = common_commands.PCS_RESOURCE_DISABLE_ENABLE\
             .format(operation, service)
         self.node_utils.execute_cmd(cmd=command, read_lines=True)
-        time.sleep(30)
-        resp = self.health_obj.pcs_service_status(service)
+        resp = self._wait_pcs_status(service, running=operation != "disable", deadline=30)
         return resp
 
     def alert_validation(self, string_list: list, restart: bool = True) -> \
@@ -573,51 +636,45 @@ class RASCoreLib:
             time.sleep(common_cfg["sleep_val"])
 
         LOGGER.info("Checking status of sspl and kafka services")
-        resp = self.s3obj.get_s3server_service_status(
-            service=common_cfg["service"]["sspl_service"],
-            host=self.host, user=self.username, pwd=self.pwd)
-        if not resp[0]:
-            return resp
-        resp = self.s3obj.get_s3server_service_status(
-            service=common_cfg["service"]["kafka_service"],
-            host=self.host, user=self.username, pwd=self.pwd)
-        if not resp[0]:
-            return resp
+        # Each probe opens its own SSH connection, so both can run at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(
+                self.s3obj.get_s3server_service_status, service=service,
+                host=self.host, user=self.username, pwd=self.pwd)
+                for service in (common_cfg["service"]["sspl_service"],
+                                common_cfg["service"]["kafka_service"])]
+            for future in futures:
+                resp = future.result()
+                if not resp[0]:
+                    return resp
         LOGGER.info(
             "Verified sspl and kafka services are in running state")
         time.sleep(common_cfg["sleep_val"])
 
         LOGGER.info("Fetching sspl alert response")
+        alert_log = common_cfg["file"]["alert_log_file"]
+        # Copy the screen log, keep the matching alerts on the node and stream them back
         cmd = common_commands.COPY_FILE_CMD.format(
-            common_cfg["file"]["screen_log"],
-            common_cfg["file"]["alert_log_file"])
-
-        self.node_utils.execute_cmd(
-            cmd=cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
+            common_cfg["file"]["screen_log"], alert_log)
+        cmd = f"{cmd} > /dev/null && grep -- {shlex.quote(string_list[0])} " \
+              f"{shlex.quote(alert_log)} | " \
+              f"tee {shlex.quote(common_cfg['file']['extracted_alert_file'])}"
+        LOGGER.info(
+            "Checking if alerts are generated on message bus")
+        LOGGER.debug(cmd)
+        alerts = self.node_utils.execute_cmd(cmd=cmd).decode("utf-8", errors="replace")
         LOGGER.info("Successfully fetched the alert response")
-
-        LOGGER.debug("Reading the alert log file")
-        read_resp = self.node_utils.read_file(
-            filename=common_cfg["file"]["alert_log_file"],
-            local_path=common_cfg["file"]["temp_txt_file"])
         LOGGER.debug(
             "======================================================")
-        LOGGER.debug(read_resp)
+        LOGGER.debug(alerts)
         LOGGER.debug(
             "======================================================")
-        LOGGER.info(
-            "Checking if alerts are generated on message bus")
-        cmd = common_commands.EXTRACT_LOG_CMD.format(
-            common_cfg["file"]["alert_log_file"], string_list[0],
-            common_cfg["file"]["extracted_alert_file"])
-        LOGGER.debug(cmd)
-        self.node_utils.execute_cmd(cmd=cmd, read_nbytes=cmn_cons.BYTES_TO_READ)
 
-        resp = self.validate_alert_msg(
-            remote_file_path=common_cfg["file"]["extracted_alert_file"],
-            pattern_lst=string_list)
-        if not resp[0]:
-            return resp
+        for pattern in string_list:
+            if pattern not in alerts:
+                LOGGER.info("Match not found : %s", pattern)
+                return False, pattern
+            LOGGER.info("Match found : %s", pattern)
 
         LOGGER.info("Fetched sspl alerts")
         return True, "Fetched alerts successfully"
@@ -634,22 +691,36 @@ class RASCoreLib:
         :rtype: tuple
         """
         response = None
-        local_path = os.path.join(os.getcwd(), 'temp_file')
-
-        if os.path.exists(local_path):
+        remote_file = shlex.quote(remote_file_path)
+        # One remote exec reporting the index of every pattern found in the file
+        cmd = "; ".join(
+            f"grep -qF -- {shlex.quote(pattern)} {remote_file} && echo {index}"
+            for index, pattern in enumerate(pattern_lst))
+        try:
+            output = self.node_utils.execute_cmd(cmd=f"{cmd}; true")
+            found = {int(index) for index in output.decode("utf-8").split()}
+            content = None
+        except (IOError, ValueError) as error:
+            LOGGER.warning("Remote scan failed, checking local copy: %s", error)
+            local_path = os.path.join(os.getcwd(), 'temp_file')
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            _ = self.node_utils.copy_file_to_local(remote_path=remote_file_path,
+                                                   local_path=local_path)
+            # Alert logs may carry stray non utf-8 bytes, don't fail on them
+            with open(local_path, "rb") as fin:
+                content = fin.read().decode("utf-8", errors="replace")
             os.remove(local_path)
-        _ = self.node_utils.copy_file_to_local(remote_path=remote_file_path,
-                                               local_path=local_path)
-        for pattern in pattern_lst:
-            if pattern in open(local_path, encoding="utf-8").read():
-                response = pattern
-            else:
+            found = None
+
+        for index, pattern in enumerate(pattern_lst):
+            matched = index in found if content is None else pattern in content
+            if not matched:
                 LOGGER.info("Match not found : %s", pattern)
-                os.remove(local_path)
                 return False, pattern
+            response = pattern
             LOGGER.info("Match found : %s", pattern)
 
-        os.remove(local_path)
         return True, response
 
     def check_service_recovery(self, service, delay=40):
@@ -855,15 +926,10 @@ class RASCoreLib:
             return False, "Failed to copy the file"
         self.change_file_mode(path=path)
         LOGGER.info("Getting cluster id")
-        cluster_id = self.get_cluster_id()
-        cluster_id = cluster_id[1].decode("utf-8")
-        cluster_id = " ".join(cluster_id.split())
-        cluster_id = cluster_id.split(' ')[-1]
+        cluster_id = self.cluster_id
 
         LOGGER.info("Encrypting the password")
-        val = self.encrypt_pwd(password, cluster_id)
-        val = (val[1].split()[-1]).decode("utf-8")
-        val = (repr(val)[2:-1]).replace('\'', '')
+        val = _encrypted_token(self.encrypt_pwd(password, cluster_id)[1])
         return True, val
 
     def get_ipmi_sensor_list(self, sensor_type: str = None) -> list:
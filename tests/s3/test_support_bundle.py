@@ -22,32 +22,133 @@
 import time
 import os
 import posixpath
-from multiprocessing import Process, Manager
+import shlex
+import stat
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import logging
+import paramiko
 import pytest
-from pysftp.exceptions import ConnectionException
 from config import CMN_CFG as CM_CFG
 from libs.s3 import S3H_OBJ, S3_CFG
 from commons.constants import const
 from commons import commands as cmd
 from commons.ct_fail_on import CTFailOn
-from commons.helpers.node_helper import Node
 from commons.params import LOG_DIR
 from commons.errorcodes import error_handler
-from commons.utils.system_utils import run_remote_cmd
 from commons.utils.assert_utils import assert_false
 from commons.utils.assert_utils import assert_true
 from commons.utils import support_bundle_utils as sb
 from commons.utils import system_utils
 from commons.utils import assert_utils
 
-manager = Manager()
+LOGGER = logging.getLogger(__name__)
+# Sub dir and suffix of the tar written by the bundle script
+BUNDLE_SUB_DIR = "s3"
+BUNDLE_TAR_POSTFIX = "tar.xz"
+# 512 KiB records instead of the 10 KiB default, no chown per extracted file
+TAR_EXTRACT_CMD = "tar -b 1024 --no-same-owner -xf"
+# Only these members of the shared bundle are validated by the tests using it
+SHARED_BUNDLE_MEMBERS = [const.S3_LOG_PATH, const.AUTHSERVER_LOG_PATH,
+                         const.HAPROXY_LOG_PATH, "tmp/s3_support_bundle_*"] + const.CFG_FILES
+
+
+def _run_on_primary(command):
+    """
+    Run the command on the primary node over a short lived SSH connection.
+
+    :param str command: Command to be executed
+    :return: (exit status, stdout)
+    """
+    node = CM_CFG["nodes"][0]
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(node["host"], username=node["username"], password=node["password"],
+                   timeout=30)
+    try:
+        _, stdout, _ = client.exec_command(command)
+        exit_status = stdout.channel.recv_exit_status()
+        return exit_status, stdout.read().decode("utf-8", errors="replace")
+    finally:
+        client.close()
+
+
+def _bundle_prefix(worker_id):
+    """
+    Bundle name template of a pytest-xdist worker, formatted with the test id.
+
+    :param str worker_id: pytest-xdist worker id, "master" without xdist
+    :return: str.format template of the bundle names
+    """
+    return "auto_bundle_" + worker_id + "_{}"
+
+
+def _bundle_tar_paths(bundle_name, dest_dir):
+    """
+    Where the bundle script writes the tar of a bundle.
+
+    :param str bundle_name: Name of the bundle
+    :param str dest_dir: Destination dir given to the bundle script
+    :return: (tar destination dir, tar file path)
+    """
+    # The bundle script resolves relative dirs against its own cwd
+    assert_true(dest_dir.startswith("/"), f"Not an absolute path: {dest_dir}")
+    tar_dest_dir = "{}/{}".format(dest_dir.rstrip("/"), BUNDLE_SUB_DIR)
+    return tar_dest_dir, "{}/s3_{}.{}".format(tar_dest_dir, bundle_name, BUNDLE_TAR_POSTFIX)
+
+
+def _create_shared_bundle(worker_id):
+    """
+    Create and extract the support bundle shared by the bundle content tests.
+
+    :param str worker_id: pytest-xdist worker id, keeps the bundle dir apart
+    from other runs
+    :return: dict with bundle_dir, tar_file_path and tar_dest_dir
+    """
+    bundle_dir = posixpath.join(
+        const.REMOTE_DEFAULT_DIR, "auto_support_bundle_shared_" + worker_id)
+    bundle_name = _bundle_prefix(worker_id).format("shared")
+    tar_dest_dir, tar_file_path = _bundle_tar_paths(bundle_name, bundle_dir)
+    LOGGER.info("Creating shared support bundle %s", tar_file_path)
+    exit_status, output = _run_on_primary(
+        "rm -rf -- {0} && mkdir -p {0} && {1} {2} {0}".format(
+            shlex.quote(bundle_dir), cmd.BUNDLE_CMD, bundle_name))
+    assert_true(exit_status == 0 and const.SUPPORT_BUNDLE_SUCCESS_MSG in output, output)
+    # Extract just the validated members instead of the whole archive; a
+    # missing member is reported by the test checking it, not here
+    exit_status, output = _run_on_primary(
+        "{} {} -C {} --wildcards --no-anchored {} 2>&1".format(
+            TAR_EXTRACT_CMD, shlex.quote(tar_file_path), shlex.quote(tar_dest_dir),
+            " ".join(shlex.quote(path.lstrip("/")) for path in SHARED_BUNDLE_MEMBERS)))
+    if exit_status:
+        LOGGER.warning("Partial extraction of %s: %s", tar_file_path, output)
+    return {"bundle_dir": bundle_dir, "tar_file_path": tar_file_path,
+            "tar_dest_dir": tar_dest_dir}
+
+
+@pytest.fixture(scope="session")
+def shared_support_bundle(worker_id):
+    """
+    Session level fixture creating one extracted support bundle for the tests
+    which only validate its contents, removed again at the end of the session.
+    """
+    bundle = _create_shared_bundle(worker_id)
+    yield bundle
+    _run_on_primary("rm -rf -- {}".format(shlex.quote(bundle["bundle_dir"])))
 
 
 # pylint: disable-msg=too-many-public-methods
 class TestSupportBundle:
-    """Support Bundle Testsuite."""
+    """
+    Support Bundle Testsuite.
+
+    Some tests stop the cluster or its services, so the tests of this module
+    must not run alongside each other: under pytest-xdist use
+    ``--dist=loadfile``, which keeps the whole module on one worker. The remote work dir and bundle
+    names carry the worker id, keeping it apart from other runs on the node.
+    """
 
     log = logging.getLogger(__name__)
 
@@ -61,36 +162,173 @@ class TestSupportBundle:
         teardown for cleanup
         """
         cls.log.info("STARTED: Setup operations")
-        cls.file_lst = []
+        # Remote paths removed by teardown, nested ones are dropped there
+        cls.file_lst = set()
         cls.pcs_start = True
         cls.host_ip = CM_CFG["nodes"][0]["host"]
         cls.uname = CM_CFG["nodes"][0]["username"]
         cls.passwd = CM_CFG["nodes"][0]["password"]
         cls.sys_bundle_dir = const.REMOTE_DEFAULT_DIR
-        cls.tar_postfix = "tar.xz"
+        # Unique per pytest-xdist worker so that parallel runs do not share paths
+        cls.worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        cls.work_dir = posixpath.join(
+            cls.sys_bundle_dir, "auto_support_bundle_{}".format(cls.worker_id))
         cls.tmp_dir = "tmp"
         cls.extracted_m0trace_path = "s3_m0trace_files"
         cls.s3server_pre = "s3server"
         cls.m0postfix = "m0trace"
-        cls.common_dir = "s3"
+        cls.common_dir = BUNDLE_SUB_DIR
+        cls.success_msg = const.SUPPORT_BUNDLE_SUCCESS_MSG
+        cls.bundle_cmd = (cmd.BUNDLE_CMD + " {} {}").format
+        cls.cluster_status_msg = const.CLUSTER_STATUS_MSG
+        cls.cluster_not_running_msg = const.CLUSTER_NOT_RUNNING_MSG
         cls.log.info("ENDED: Setup operations")
         cls.bundle_dir = os.path.join(LOG_DIR, "latest", "support_bundle")
+        # SSH clients shared by all the tests of the class, keyed by host
+        cls._ssh_pool = dict()
+        cls._ssh_lock = threading.Lock()
+        cls._sftp_by_host = dict()
+        # Remote directories already created on the primary node
+        cls._dir_cache = set()
+
+    @classmethod
+    def teardown_class(cls):
+        """Function will be invoked after all the test cases of the class."""
+        for sftp in cls._sftp_by_host.values():
+            sftp.close()
+        cls._sftp_by_host.clear()
+        for client in cls._ssh_pool.values():
+            client.close()
+        cls._ssh_pool.clear()
 
     # pylint: disable=attribute-defined-outside-init
     def setup_method(self):
         """Function will be invoked prior to each test case."""
-        self.node_obj = Node(hostname=self.host_ip, username=self.uname, password=self.passwd)
-        self.node_obj.connect()
-        self.host_obj = self.node_obj.host_obj
-        self.node_obj.connect_pysftp()
-        self.pysftp_obj = self.host_obj.open_sftp()
-        self.bundle_prefix = "auto_bundle_{}"
-        self.common_dir = "s3"
+        # SSH and SFTP sessions are pooled for the lifetime of the class
+        self.host_obj = self.get_ssh_client(self.host_ip)
+        self.sftp = self.get_sftp(self.host_ip)
+        self._attr_cache = {}
+        self.bundle_prefix = _bundle_prefix(self.worker_id)
+        self.common_dir = BUNDLE_SUB_DIR
         if system_utils.path_exists(self.bundle_dir):
             self.log.info("Removing existing directory %s", self.bundle_dir)
             system_utils.remove_dirs(self.bundle_dir)
         system_utils.make_dirs(self.bundle_dir)
 
+    @pytest.fixture()
+    def shared_bundle(self, shared_support_bundle):
+        """Function exposes the session wide support bundle paths to the test."""
+        self.shared_bundle_paths = shared_support_bundle
+
+    @pytest.fixture()
+    def remote_workdir(self):
+        """Function creates the remote work dir of the test, teardown removes it."""
+        assert_true(self.ensure_dir(self.work_dir), self.work_dir)
+        self.file_lst.add(self.work_dir)
+
+    def get_ssh_client(self, hostname):
+        """
+        Function returns the pooled SSH client of the host, connecting on first use.
+
+        :param str hostname: Host name or ip
+        :return: paramiko.SSHClient
+        """
+        with self._ssh_lock:
+            client = self._ssh_pool.get(hostname)
+            transport = client.get_transport() if client else None
+            if transport is None or not transport.is_active():
+                client = paramiko.SSHClient()
+                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                client.connect(hostname, username=self.uname, password=self.passwd,
+                               timeout=30)
+                client.get_transport().set_keepalive(30)
+                self._ssh_pool[hostname] = client
+            return client
+
+    def _prepare_bundle(self, test_id):
+        """
+        Function returns the paths of the support bundle of a test, created in
+        the work dir set up by the remote_workdir fixture.
+
+        :param str test_id: Suffix of the bundle name, usually the test number
+        :return: (bundle name, remote work dir, tar destination dir, tar file path)
+        """
+        bundle_name = self.bundle_prefix.format(test_id)
+        remote_path = self.work_dir
+        return (bundle_name, remote_path) + _bundle_tar_paths(bundle_name, remote_path)
+
+    def ensure_dir(self, dir_path):
+        """
+        Function creates the remote directory with its parents if not created already.
+
+        :param str dir_path: Remote path of the directory
+        :return: True if directory exists
+        """
+        if dir_path in self._dir_cache:
+            return True
+        resp = self.remote_execution("mkdir -p {}".format(shlex.quote(dir_path)))
+        if resp[0]:
+            self._dir_cache.add(dir_path)
+        return resp[0]
+
+    def forget_dir(self, dir_path):
+        """
+        Function drops the removed remote directory and its children from the cache.
+
+        :param str dir_path: Remote path of the directory
+        """
+        prefix = dir_path.rstrip("/") + "/"
+        self._dir_cache.difference_update(
+            [path for path in self._dir_cache if path == dir_path or path.startswith(prefix)])
+
+    def get_sftp(self, hostname):
+        """
+        Function returns the SFTP client of the host, opening it on the pooled
+        SSH connection on first use.
+
+        :param str hostname: Host name or ip
+        :return: paramiko.SFTPClient
+        """
+        client = self.get_ssh_client(hostname)
+        sftp = self._sftp_by_host.get(hostname)
+        if sftp is None or sftp.get_channel().closed \
+                or sftp.get_channel().get_transport() is not client.get_transport():
+            sftp = client.open_sftp()
+            self._sftp_by_host[hostname] = sftp
+        return sftp
+
+    def remote_path_exists(self, path, host=None):
+        """
+        Function checks the remote path exists using the pooled SFTP session.
+
+        :param str path: Remote path
+        :param str host: Host name or ip, defaults to the primary node
+        :return: Boolean
+        """
+        try:
+            self.get_sftp(host or self.host_ip).stat(path)
+        except IOError:
+            return False
+        return True
+
+    def remote_execution(self, command, host=None):
+        """
+        Function executes the command on a new channel of the pooled SSH connection.
+
+        :param str command: Command to be executed
+        :param str host: Host name or ip, defaults to the primary node
+        :return: (Boolean and response)
+        """
+        client = self.get_ssh_client(host or self.host_ip)
+        _, stdout, stderr = client.exec_command(command)
+        exit_status = stdout.channel.recv_exit_status()
+        output = stdout.read()
+        error = stderr.read()
+        if error:
+            self.log.debug("Error: %s", error)
+            return False, error
+        return exit_status == 0, output
+
     def create_support_bundle(
             self,
             bundle_name,
@@ -100,25 +338,47 @@ class TestSupportBundle:
         """
         Function creates the support bundle collection tar file on the remote s3server.
 
+        As with run_remote_cmd, the collection only succeeds when the command
+        exits with 0 and writes nothing on stderr, on top of printing the
+        success message.
         :param str bundle_name: Name of the bundle file to be created
         :param str dest_dir: Destination path where support bundle will be created
         :param None or List resp_lst: list containing response
         :param str host_ip: IP of the s3 remote server
-        :return: (Boolean and Response)
+        :return: (Boolean and Response), response is the decoded stderr if any
+        else the decoded stdout
         """
-        success_msg = const.SUPPORT_BUNDLE_SUCCESS_MSG
-        final_cmd = "{} {} {}".format(cmd.BUNDLE_CMD, bundle_name, dest_dir)
+        success_msg = self.success_msg
+        # exec keeps the shell pid, which the script uses to name its
+        # /tmp/s3_support_bundle_<pid> work dir
+        final_cmd = "echo $$ && exec " + self.bundle_cmd(bundle_name, dest_dir)
         self.log.info("Command to execute : %s", final_cmd)
-        resp = run_remote_cmd(
-            final_cmd, host_ip, self.uname, self.passwd)
-        if resp[0]:
-            if success_msg in str(resp[1]):
-                if resp_lst:
-                    resp_lst.append(True, resp[1])
-                return True, resp[1]
-        if resp_lst:
-            resp_lst.append(False, resp[1])
-        return False, resp[1]
+        _, stdout, stderr = self.get_ssh_client(host_ip).exec_command(final_cmd)
+        pid = stdout.readline().strip()
+        if pid.isdigit() and host_ip == self.host_ip:
+            # Left over when the collection fails, teardown removes it
+            self.file_lst.add("/tmp/s3_support_bundle_" + pid)
+        # stderr is drained alongside stdout, so that a chatty stderr can not
+        # fill its channel window and stall the command
+        error = []
+        err_reader = threading.Thread(target=lambda: error.append(stderr.read()))
+        err_reader.start()
+        # Scan the output as it streams in. Callers check the tar right after,
+        # so the command is still waited on before returning.
+        found = False
+        output = []
+        for line in iter(stdout.readline, ""):
+            output.append(line)
+            if not found and success_msg in line:
+                self.log.debug("Success message received for %s", bundle_name)
+                found = True
+        exit_status = stdout.channel.recv_exit_status()
+        err_reader.join()
+        error = error[0].decode("utf-8", errors="replace") if error else ""
+        resp = (exit_status == 0 and not error and found, error or "".join(output))
+        if resp_lst is not None:
+            resp_lst.append(resp)
+        return resp
 
     def get_s3_instaces_and_ism0exists(self, abs_path, check_file):
         """
@@ -133,37 +393,68 @@ class TestSupportBundle:
         var_mero_dict = dict()
         self.log.debug("Client connected")
         try:
-            dir_lst = self.pysftp_obj.listdir(abs_path)
+            dir_lst = self.list_remote_dir(abs_path)
             for directory in [dir_el for dir_el in dir_lst if "s3server" in dir_el]:
-                abs_dir_name = os.path.join(abs_path, directory)
-                file_lst = self.pysftp_obj.listdir(abs_dir_name)
-                var_mero_dict[abs_dir_name] = [
-                    file for file in file_lst if check_file in file]
-                m0_flag = [True for file in file_lst if check_file in file]
-                if not any(m0_flag):
+                abs_dir_name = posixpath.join(abs_path, directory)
+                matches = [file for file in self.list_remote_dir(abs_dir_name)
+                           if check_file in file]
+                var_mero_dict[abs_dir_name] = matches
+                if not matches:
                     return False, var_mero_dict
             return True, var_mero_dict
-        except (ConnectionException, FileNotFoundError) as error:
+        except (IOError, paramiko.SSHException) as error:
             self.log.error(error)
             return False, error
 
-    def validate_time_stamp(self, org_file_path, ext_file_path):
+    def list_remote_dir(self, dir_path):
         """
-        Function compares the last modified time of the two files.
+        Function lists a remote directory along with the attributes of its entries.
 
-        :param str org_file_path: Absolute remote path of the server
-        where actual logs are created by s3server instances
-        :param str ext_file_path: Support bundle path of the file
-        :return: Boolean
+        :param str dir_path: Absolute remote path of the directory
+        :return: dict of entry name and its SFTPAttributes
         """
-        self.log.info(
-            "Validating the time stamp of : %s with %s",
-            org_file_path, ext_file_path)
-        tmpstamp1 = self.pysftp_obj.stat(org_file_path)
-        tmpstamp2 = self.pysftp_obj.stat(ext_file_path)
-        if tmpstamp1.st_mtime == tmpstamp2.st_mtime:
-            return True
-        return False
+        if dir_path not in self._attr_cache:
+            # listdir_iter keeps several READDIR requests in flight
+            self._attr_cache[dir_path] = {
+                attr.filename: attr for attr in self.sftp.listdir_iter(dir_path)}
+        return self._attr_cache[dir_path]
+
+    def get_mtimes_and_md5sums(self, file_paths):
+        """
+        Function fetches last modified time and md5sum of all the remote files
+        in a single command, processing the files in parallel on all the cores
+        of the node.
+
+        :param list file_paths: Absolute remote paths of the files
+        :return: dict of file path and (mtime, md5sum), missing files are left out
+        """
+        md5cmd = "printf '%s\\0' {} | xargs -0 -n1 -P\"$(nproc)\" " \
+                 "sh -c 'echo \"$(stat -c %Y -- \"$1\") $(md5sum -- \"$1\")\"' _".format(
+                     " ".join(shlex.quote(path) for path in file_paths))
+        _, stdout, _ = self.host_obj.exec_command(md5cmd)
+        digests = dict()
+        for line in stdout.read().decode("utf-8").splitlines():
+            mtime, _, line = line.partition(" ")
+            checksum, _, path = line.partition("  ")
+            if mtime.isdigit() and path:
+                digests[path] = (int(mtime), checksum)
+        return digests
+
+    def get_file_sizes(self, file_paths):
+        """
+        Function fetches the size of all the remote files in a single command.
+
+        :param list file_paths: Remote paths of the files
+        :return: dict of file path and size in bytes, missing files are left out
+        """
+        stat_cmd = "stat -c '%s %n' -- {}".format(
+            " ".join(shlex.quote(path) for path in file_paths))
+        _, stdout, _ = self.host_obj.exec_command(stat_cmd)
+        sizes = dict()
+        for line in stdout.read().decode("utf-8").splitlines():
+            size, _, path = line.partition(" ")
+            sizes[path] = int(size)
+        return sizes
 
     def validate_file_checksum(self, org_m0trace_lst, x_m0trace_lst):
         """
@@ -174,27 +465,29 @@ class TestSupportBundle:
         :param list x_m0trace_lst: Bundle support m0traces files
         :return: Boolean
         """
-        md5cmd = "md5sum {}"
-        for org_file in org_m0trace_lst:
-            for ext_file in x_m0trace_lst:
-                if org_file.split("/")[-1] == ext_file.split("/")[-1]:
-                    if self.validate_time_stamp(org_file, ext_file):
-                        md5cmd_1 = md5cmd.format(org_file)
-                        md5cmd_2 = md5cmd.format(ext_file)
-                        cheksum_res_1 = run_remote_cmd(
-                            md5cmd_1, self.host_ip, self.uname, self.passwd)
-                        cheksum_res_2 = run_remote_cmd(
-                            md5cmd_2, self.host_ip, self.uname, self.passwd)
-                        cheksum_res_1 = cheksum_res_1[0].split()[0].strip()
-                        cheksum_res_2 = cheksum_res_2[0].split()[0].strip()
-                        if cheksum_res_1 != cheksum_res_2:
-                            self.log.info(
-                                "Failed Checksum: %s:%s and %s:%s",
-                                md5cmd_1,
-                                cheksum_res_1,
-                                md5cmd_2,
-                                cheksum_res_2)
-                            return False
+        ext_files = dict()
+        for ext_file in x_m0trace_lst:
+            ext_files.setdefault(posixpath.basename(ext_file), []).append(ext_file)
+        file_pairs = [
+            (org_file, ext_file) for org_file in org_m0trace_lst
+            for ext_file in ext_files.get(posixpath.basename(org_file), [])]
+        if not file_pairs:
+            return True
+        # Time stamps and checksums of both sides come from a single pass over the files
+        digests = self.get_mtimes_and_md5sums({path for pair in file_pairs for path in pair})
+        for org_file, ext_file in file_pairs:
+            mtime_1, cheksum_res_1 = digests.get(org_file, (None, None))
+            mtime_2, cheksum_res_2 = digests.get(ext_file, (None, None))
+            if None not in (mtime_1, mtime_2) and mtime_1 != mtime_2:
+                continue
+            if cheksum_res_1 is None or cheksum_res_1 != cheksum_res_2:
+                self.log.info(
+                    "Failed Checksum: %s:%s and %s:%s",
+                    org_file,
+                    cheksum_res_1,
+                    ext_file,
+                    cheksum_res_2)
+                return False
         return True
 
     def compare_files(self, remotepath, ext_path_dict):
@@ -208,40 +501,26 @@ class TestSupportBundle:
         """
         x_m0trace_lst = list()
         m0post_fix = self.m0postfix
-        for filename in self.pysftp_obj.listdir(remotepath):
+        s3server_pre = self.s3server_pre
+        ext_dirs = dict()
+        for dirname, files in ext_path_dict.items():
+            ext_dirs.setdefault(dirname.rpartition("/")[2], []).append((dirname, files))
+        for filename, attr in self.list_remote_dir(remotepath).items():
+            if filename not in ext_dirs or s3server_pre not in filename \
+                    or not stat.S_ISDIR(attr.st_mode):
+                continue
             rpath = posixpath.join(remotepath, filename)
-            if self.s3server_pre in filename:
-                org_m0trace_lst = self.pysftp_obj.listdir(rpath)
-                org_m0trace_lst = [
-                    os.path.join(rpath, file)
-                    for file in org_m0trace_lst if m0post_fix in file]
-                for dirname, x_m0trace_lst in ext_path_dict.items():
-                    if dirname.split("/")[-1] == filename:
-                        x_m0trace_lst = [
-                            os.path.join(
-                                dirname,
-                                file) for file in x_m0trace_lst]
-                        resp = self.validate_file_checksum(
-                            org_m0trace_lst, x_m0trace_lst)
-                        if not resp:
-                            return False, org_m0trace_lst
+            org_m0trace_lst = [
+                posixpath.join(rpath, file)
+                for file in self.list_remote_dir(rpath) if m0post_fix in file]
+            for dirname, files in ext_dirs[filename]:
+                x_m0trace_lst = [posixpath.join(dirname, file) for file in files]
+                resp = self.validate_file_checksum(
+                    org_m0trace_lst, x_m0trace_lst)
+                if not resp:
+                    return False, org_m0trace_lst
         return True, x_m0trace_lst
 
-    def extract_tar_file(self, tar_file_path, tar_dest_dir, **kwargs):
-        """
-        Function to extract tar file in remote node.
-
-        :param tar_file_path: Path to the tar file
-        :param tar_dest_dir: Destination path to for extracting tar
-        :keyword host: Host name or ip
-        :return:
-        """
-        host = kwargs.get("host", self.host_ip)
-        tar_cmd = "tar -xvf {} -C {}".format(tar_file_path, tar_dest_dir)
-        self.log.debug("Command to be executed %s on %s", tar_cmd, host)
-        return run_remote_cmd(
-            tar_cmd, host, self.uname, self.passwd)
-
     def pcs_start_stop_cluster(self, start_stop_cmd, status_cmd):
         """
         Function start and stops the cluster using the pcs command.
@@ -250,15 +529,10 @@ class TestSupportBundle:
         :param string status_cmd: status command option
         :return: (Boolean and response)
         """
-        cluster_msg = const.CLUSTER_STATUS_MSG
+        cluster_msg = self.cluster_status_msg
         self.host_obj.exec_command(start_stop_cmd)
-        time.sleep(30)
-        _, stdout, stderr = self.host_obj.exec_command(status_cmd)
-        result = stdout.readlines() if stdout.readlines() else stderr.readlines()
-        for value in result:
-            if cluster_msg in value:
-                return False, result
-        return True, result
+        return self.poll_cluster_status(
+            status_cmd, lambda lines: not any(cluster_msg in value for value in lines))
 
     def hctl_stop_cmd(self):
         """
@@ -266,18 +540,68 @@ class TestSupportBundle:
 
         :return:(Boolean and response)
         """
-        cluster_msg = const.CLUSTER_NOT_RUNNING_MSG
+        cluster_msg = self.cluster_not_running_msg
         stop_cmd = cmd.PCS_CLUSTER_STOP.format("--all")
         status_cmd = cmd.MOTR_STATUS_CMD
-        resp = run_remote_cmd(
-            stop_cmd, self.host_ip, self.uname, self.passwd)
+        resp = self.remote_execution(stop_cmd)
         self.log.info("hctl Stop resp : %s", resp)
-        time.sleep(30)
-        _, stdout, stderr = self.host_obj.exec_command(status_cmd)
-        result = stdout.readlines() if stdout.readlines() else stderr.readlines()
-        if cluster_msg in result[0].strip():
-            return True, result
-        return False, result
+        return self.poll_cluster_status(
+            status_cmd, lambda lines: bool(lines) and cluster_msg in lines[0].strip())
+
+    def poll_cluster_status(self, status_cmd, is_done, timeout=30, interval=2):
+        """
+        Function polls the cluster status until the expected state is reached.
+
+        :param str status_cmd: status command option
+        :param is_done: callable taking the status output lines, True once the
+        cluster reached the expected state
+        :param int timeout: maximum time in seconds to wait
+        :param int interval: time in seconds between two polls
+        :return: (Boolean and response)
+        """
+        deadline = time.time() + timeout
+        while True:
+            _, stdout, stderr = self.host_obj.exec_command(status_cmd)
+            out = stdout.readlines()
+            result = out if out else stderr.readlines()
+            if is_done(result):
+                return True, result
+            if time.time() + interval > deadline:
+                return False, result
+            time.sleep(interval)
+
+    def get_s3server_roles(self):
+        """
+        Function fetches the pacemaker role of every s3server resource from a
+        single ``pcs status xml`` call.
+
+        :return: (Boolean and dict of resource id and its role or error)
+        """
+        resp = self.remote_execution(cmd.CMD_PCS_GET_XML)
+        if not resp[0]:
+            return resp
+        root = ET.fromstring(resp[1])
+        return True, {res.get("id"): res.get("role") for res in root.iter("resource")
+                      if "s3server" in res.get("id", "")}
+
+    def poll_s3server_roles(self, role, timeout=30, interval=2):
+        """
+        Function polls the pacemaker roles until every s3server resource has the role.
+
+        :param str role: expected pacemaker role, e.g. Stopped
+        :param int timeout: maximum time in seconds to wait
+        :param int interval: time in seconds between two polls
+        :return: (Boolean and dict of resource id and its role or error)
+        """
+        deadline = time.time() + timeout
+        while True:
+            resp = self.get_s3server_roles()
+            if resp[0] and resp[1] and all(
+                    res_role == role for res_role in resp[1].values()):
+                return resp
+            if time.time() + interval > deadline:
+                return False, resp[1]
+            time.sleep(interval)
 
     def teardown_method(self):
         """
@@ -294,16 +618,20 @@ class TestSupportBundle:
                 cmd.PCS_CLUSTER_STATUS)
             self.pcs_start = resp[0]
         self.log.info("Step: Deleting all the remote files")
-        if self.file_lst:
-            for path in self.file_lst:
-                self.log.info("Deleting %s", path)
-                S3H_OBJ.delete_remote_dir(self.pysftp_obj, path)
-        run_remote_cmd(
-            "rm -rf /tmp/s3_support_bundle*",
-            self.host_ip,
-            self.uname,
-            self.passwd)
-        self.node_obj.disconnect()
+        # Only the top level paths, the nested ones go along with their parent
+        roots = []
+        for path in sorted(path.rstrip("/") for path in self.file_lst):
+            if not any(path.startswith(root + "/") for root in roots):
+                roots.append(path)
+        for path in roots:
+            self.log.info("Deleting %s", path)
+            self.forget_dir(path)
+        # All the test directories and the temp dirs of the bundles created by
+        # the test in one remote command, those of other workers are kept
+        if roots:
+            self.remote_execution("rm -rf -- {}".format(
+                " ".join(shlex.quote(path) for path in roots)))
+        self.file_lst.clear()
         self.log.info("Step : Deleted all the files")
         self.log.info("ENDED: Teardown operations")
 
@@ -316,16 +644,22 @@ class TestSupportBundle:
         """Support bundle collection when destination has less space than required."""
         self.log.info(
             "STARTED: Support bundle collection when destination has less space than required")
-        common_dir = self.common_dir
-        dir_path = os.path.join(common_dir, "/boot")
-        remote_path = self.node_obj.make_dir(dir_path)
+        dir_path = "/boot"
+        remote_path = self.ensure_dir(dir_path)
         assert_true(remote_path, f"Path not exists: {dir_path}")
-        self.file_lst.append(os.path.join(dir_path))
-        for i in range(10):
-            bundle_name = "{}_{}".format(self.bundle_prefix.format("5274"), str(i))
+        # Only the bundle output dir is cleaned up, never /boot itself
+        out_dir = posixpath.join(dir_path, self.common_dir)
+        self.file_lst.add(out_dir)
+        bundle_names = ["{}_{}".format(self.bundle_prefix.format("5274"), str(i))
+                        for i in range(10)]
+        # Sequential on purpose, a concurrent sibling could use up the space
+        # and make a collection fail for the wrong reason
+        for bundle_name in bundle_names:
             self.log.info("Step 1: Creating support bundle %s.tar.gz", bundle_name)
-            resp = self.create_support_bundle(
-                bundle_name, dir_path, self.host_ip)
+            resp = self.create_support_bundle(bundle_name, dir_path, self.host_ip)
+            # No partial bundle is left behind on the boot partition
+            self.remote_execution("rm -rf -- {}".format(shlex.quote(out_dir)))
+            self.forget_dir(out_dir)
             if not resp[0]:
                 self.log.info(
                     "Step 1: Failed to create support bundle %s.tar.gz message : %s",
@@ -342,33 +676,22 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8025")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collect_triggered_simultaneously_5280(self):
         """Test multiple Support bundle collection triggered simultaneously."""
         self.log.info("STARTED: Test multiple Support bundle collection triggered simultaneously")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        resp_lst = manager.list()
-        process_lst = []
+        remote_path = self.work_dir
         self.log.info(
             "Step 1: Creating support bundle parallely %s.tar.gz",
             self.bundle_prefix.format("5280"))
-        for i in range(3):
-            bundle_name = "{}_{}".format(self.bundle_prefix.format("5280"), str(i))
-            process = Process(
-                target=self.create_support_bundle,
-                args=(bundle_name,
-                      remote_path,
-                      self.host_ip,
-                      resp_lst))
-            process_lst.append(process)
-        for process in process_lst:
-            process.start()
-        for process in process_lst:
-            process.join()
+        bundle_names = ["{}_{}".format(self.bundle_prefix.format("5280"), str(i))
+                        for i in range(3)]
+        # Each worker runs on its own channel of the pooled SSH connection
+        with ThreadPoolExecutor(max_workers=len(bundle_names)) as executor:
+            futures = [executor.submit(self.create_support_bundle, name, remote_path,
+                                       self.host_ip) for name in bundle_names]
+            resp_lst = [future.result() for future in as_completed(futures)]
         true_flag = all([temp[0] for temp in resp_lst])
         assert_true(true_flag, resp_lst)
         self.log.info(
@@ -380,40 +703,37 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8026")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_core_m0traces_all_instances_5282(self):
         """Validate Support bundle contains cores and m0traces for all instances."""
         self.log.info(
             "STARTED: Validate Support bundle contains cores and m0traces for all instances")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
+        remote_path = self.work_dir
         for i in range(1):
             bundle_name = "{}_{}".format(self.bundle_prefix.format("5282"), str(i))
-            bundle_tar_name = "s3_{}.{}".format(
-                bundle_name, self.tar_postfix)
+            tar_dest_dir, tar_file_path = _bundle_tar_paths(bundle_name, remote_path)
             self.log.info(
-                "Step 1: Creating support bundle %s", bundle_tar_name)
+                "Step 1: Creating support bundle %s", tar_file_path)
             resp = self.create_support_bundle(
                 bundle_name, remote_path, self.host_ip)
             assert_true(resp[0], resp[1])
             self.log.info(
                 "Step 1: Successfully created support bundle: %s, %s",
                 bundle_name, resp)
-            tar_file_path = os.path.join(
-                remote_path, tar_dest_dir, bundle_tar_name)
-            extracted_dir = os.path.join(tar_dest_dir, bundle_name)
-            self.node_obj.make_dir(extracted_dir)
+            extracted_dir = posixpath.join(tar_dest_dir, bundle_name)
             self.log.info(
                 "Step 2 and 3: Extracting the tar file and "
                 "validating the tar extraction")
-            self.extract_tar_file(tar_file_path, tar_dest_dir)
-            dir_list = self.pysftp_obj.listdir(
-                os.path.join(extracted_dir, self.tmp_dir))
-            abs_m0trace_path = os.path.join(
+            # Create, extract and list the bundle tmp dir in a single remote command
+            resp = self.remote_execution(
+                "mkdir -p {0} && {1} {2} -C {3} && ls -1 {4}".format(
+                    shlex.quote(extracted_dir), TAR_EXTRACT_CMD, shlex.quote(tar_file_path),
+                    shlex.quote(tar_dest_dir),
+                    shlex.quote(posixpath.join(extracted_dir, self.tmp_dir))))
+            assert_true(resp[0], resp[1])
+            dir_list = resp[1].decode("utf-8").split()
+            abs_m0trace_path = posixpath.join(
                 extracted_dir,
                 self.tmp_dir,
                 dir_list[0],
@@ -437,26 +757,19 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8691 ")
+    @pytest.mark.usefixtures("remote_workdir")
     def test_collection_with_network_fluctuation_5272(self):
         """Support bundle collection with network fluctuation."""
         self.log.info(
             "STARTED: Test Support bundle collection with network fluctuation")
-        bundle_name = self.bundle_prefix.format("5272")
-        common_dir = self.common_dir
         network_service = S3_CFG["s3_services"]["network"]
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
-        resp_lst = manager.list()
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
+        bundle_name, remote_path, _, tar_file_path = self._prepare_bundle("5272")
+        # Single writer thread, list.append is atomic so no lock is needed
+        resp_lst = []
         self.log.info(
             "Step 1: Creating support bundle %s.tar.gz", bundle_name)
-        process = Process(target=self.create_support_bundle, args=(
+        # A thread rather than a process, so that it can share the pooled SSH client
+        process = threading.Thread(target=self.create_support_bundle, args=(
             bundle_name, remote_path, self.host_ip, resp_lst))
         process.start()
         self.log.info(
@@ -468,9 +781,10 @@ class TestSupportBundle:
         assert_true(resp[0], resp[1])
         self.log.info(
             "Step 2: Restarted %s service successfully", network_service)
+        process.join()
         true_flag = all([temp[0] for temp in resp_lst])
         assert_true(true_flag, resp_lst)
-        resp = self.node_obj.path_exists(tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_false(resp, f"Support bundle present at {tar_file_path}")
         self.log.info("Step 1: Support bundle did not created")
         self.log.info(
@@ -480,41 +794,33 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8692 ")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collecion_primary_secondary_nodes_5273(self):
         """Test Support bundle collection from Primary and Secondary nodes of cluster."""
         self.log.info(
             "STARTED: Test Support bundle collection from Primary and Secondary nodes of cluster")
-        remote_path = os.path.join(self.common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, self.common_dir)
+        remote_path = self.work_dir
         node_list = [self.host_ip, CM_CFG["nodes"][1]["host"]]
         self.log.info(
             "Step 1 Creating support bundle on primary and secondary nodes")
-        for node_id, hostname in enumerate(node_list):
-            host = CM_CFG["nodes"][node_id]["host"]
-            uname = CM_CFG["nodes"][node_id]["username"]
-            passwd = CM_CFG["nodes"][node_id]["password"]
-            node_obj = Node(hostname=host, username=uname, password=passwd)
+        for hostname in node_list:
             bundle_name = "{}_{}".format(self.bundle_prefix.format("5273"), str(hostname))
-            bundle_tar_name = "s3_{}.{}".format(
-                bundle_name, self.tar_postfix)
-            tar_file_path = os.path.join(
-                remote_path, tar_dest_dir, bundle_tar_name)
+            _, tar_file_path = _bundle_tar_paths(bundle_name, remote_path)
             self.log.info(
                 "Step : Creating support bundle %s on node %s",
-                bundle_tar_name, hostname)
+                tar_file_path, hostname)
             resp = self.create_support_bundle(
                 bundle_name, remote_path, hostname)
             assert_true(resp[0], resp[1])
-            resp = S3H_OBJ.is_s3_server_path_exists(tar_file_path, host=hostname)
-            assert_true(resp[0], resp[1])
+            resp = self.remote_path_exists(tar_file_path, hostname)
+            assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
             self.log.info(
                 "Step : Created support bundle %s on node %s",
-                bundle_tar_name, hostname)
-            node_obj.delete_dir_sftp(remote_path)
+                tar_file_path, hostname)
+            self.remote_execution("rm -rf -- {}".format(shlex.quote(remote_path)), hostname)
+            if hostname == self.host_ip:
+                self.forget_dir(remote_path)
         self.log.info(
             "Step 1:Support Bundle was created on primary and secondary nodes")
         self.log.info(
@@ -526,35 +832,26 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8694")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collet_authservice_down_5276(self):
         """Test Support bundle collection when authserver service is down."""
         self.log.info(
             "STARTED: Test Support bundle collection when authserver service is down")
-        bundle_name = self.bundle_prefix.format("5276")
-        common_dir = self.common_dir
         service_name = S3_CFG["s3_services"]["authserver"]
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
+        bundle_name, remote_path, _, tar_file_path = self._prepare_bundle("5276")
         self.log.info("Step 1: Stopping the service : %s", service_name)
         resp = S3H_OBJ.stop_s3server_service(service_name, self.host_ip)
         assert_false(resp[0], resp[1])
         self.log.info(
             "Step 1: Service %s was stopped successfully",
             service_name)
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
         self.log.info(
             "Step 2: Creating support bundle %s.tar.gz", bundle_name)
         resp = self.create_support_bundle(
             bundle_name, remote_path, self.host_ip)
         assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 2: Support bundle created successfully")
         self.log.info("Step 3: Starting the service : %s", service_name)
@@ -570,35 +867,26 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8695")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collection_haproxy_down_5277(self):
         """Test Support bundle collection when haproxy service is down."""
         self.log.info(
             "STARTED: Test Support bundle collection when haproxy service is down")
-        bundle_name = self.bundle_prefix.format("5277")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
         service_name = S3_CFG["s3_services"]["haproxy"]
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
+        bundle_name, remote_path, _, tar_file_path = self._prepare_bundle("5277")
         self.log.info("Step 1: Stopping the service : %s", service_name)
         resp = S3H_OBJ.stop_s3server_service(service_name, self.host_ip)
         assert_false(resp[0], resp[1])
         self.log.info(
             "Step 1: Service %s was stopped successfully",
             service_name)
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
         self.log.info(
             "Step 2: Creating support bundle %s.tar.gz", bundle_name)
         resp = self.create_support_bundle(
             bundle_name, remote_path, self.host_ip)
         assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 2: Support bundle created successfully")
         self.log.info("Step 3: Starting the service : %s", service_name)
@@ -614,33 +902,24 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8696")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collection_cluster_down_5278(self):
         """Test Support bundle collection when Cluster is shut down."""
         self.log.info(
             "STARTED: Test Support bundle collection when Cluster is shut down")
-        bundle_name = self.bundle_prefix.format("5278")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
+        bundle_name, remote_path, _, tar_file_path = self._prepare_bundle("5278")
         self.log.info("Step 1: Stopping the cluster")
         self.pcs_start = False
         resp = self.hctl_stop_cmd()
         assert_true(resp[0], resp[1])
         self.log.info("Step 1: Cluster is stopped")
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
         self.log.info(
             "Step 2: Creating support bundle %s.tar.gz", bundle_name)
         resp = self.create_support_bundle(
             bundle_name, remote_path, self.host_ip)
         assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info(
             "ENDED: Test Support bundle collection when Cluster is shut down")
@@ -649,37 +928,30 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8697")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collection_one_after_other_5279(self):
         """Test multiple Support bundle collections one after the other."""
         self.log.info(
             "STARTED: Test multiple Support bundle collections one after the other")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
+        remote_path = self.work_dir
         self.log.info(
             "Step 1: Creating multiple support bundle")
+        tar_file_paths = []
+        # Collections stay sequential, running them together is covered by 5280
         for i in range(3):
             bundle_name = "{}_{}".format(self.bundle_prefix.format("5279"), str(i))
-            bundle_tar_name = "s3_{}.{}".format(
-                bundle_name, self.tar_postfix)
-            tar_file_path = os.path.join(
-                remote_path, tar_dest_dir, bundle_tar_name)
-            self.log.info(
-                "Step : Creating support bundle %s.tar.gz", bundle_name)
+            tar_file_paths.append(_bundle_tar_paths(bundle_name, remote_path)[1])
             resp = self.create_support_bundle(
                 bundle_name, remote_path, self.host_ip)
             assert_true(resp[0], resp[1])
-            resp = self.node_obj.path_exists(tar_file_path)
-            assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
-            self.log.info(
-                "Step : Created support bundle %s.tar.gz", bundle_name)
-            self.log.info(
-                "Step 1: Successfully created support bundle message : %s, %s",
-                bundle_name, resp)
+            self.log.info("Step : Created support bundle %s", bundle_name)
+        # All the bundles are checked with a single remote stat
+        file_sizes = self.get_file_sizes(tar_file_paths)
+        for tar_file_path in tar_file_paths:
+            assert_true(tar_file_path in file_sizes,
+                        f"Support bundle does not exist at {tar_file_path}")
+        self.log.info("Step 1: Created support bundles %s", tar_file_paths)
         self.log.info(
             "ENDED: Test multiple Support bundle collections one after the other")
 
@@ -687,36 +959,22 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8698 ")
+    @pytest.mark.usefixtures("shared_bundle")
     @CTFailOn(error_handler)
     def test_s3server_logs_all_instances_5281(self):
         """Validate Support bundle contains s3server logs for all instances."""
         self.log.info(
             "STARTED: Validate Support bundle contains s3server logs for all instances")
-        bundle_name = self.bundle_prefix.format("5281")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
-        self.log.info(
-            "Step 1: Creating support bundle %s.tar.gz", bundle_name)
-        resp = self.create_support_bundle(
-            bundle_name, remote_path, self.host_ip)
-        assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        tar_file_path = self.shared_bundle_paths["tar_file_path"]
+        tar_dest_dir = self.shared_bundle_paths["tar_dest_dir"]
+        self.log.info("Step 1: Using the shared support bundle %s", tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 1: Support bundle tar created successfully")
         self.log.info(
             "Step 2: Validating the s3server logs in the support bundle tar")
-        self.extract_tar_file(tar_file_path, tar_dest_dir)
         extracted_file_path = "{}{}".format(
             tar_dest_dir, const.S3_LOG_PATH)
-        self.extract_tar_file(tar_file_path, tar_dest_dir)
         resp = self.get_s3_instaces_and_ism0exists(
             extracted_file_path, self.s3server_pre)
         assert_true(resp[0], resp[1])
@@ -729,36 +987,23 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8699")
+    @pytest.mark.usefixtures("shared_bundle")
     @CTFailOn(error_handler)
     def test_authserver_logs_5283(self):
         """Validate Support bundle contains authserver logs."""
         self.log.info(
             "STARTED: Validate Support bundle contains authserver logs")
-        bundle_name = self.bundle_prefix.format("5283")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
-        self.log.info(
-            "Step 1: Creating support bundle %s.tar.gz", bundle_name)
-        resp = self.create_support_bundle(
-            bundle_name, remote_path, self.host_ip)
-        assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        tar_file_path = self.shared_bundle_paths["tar_file_path"]
+        tar_dest_dir = self.shared_bundle_paths["tar_dest_dir"]
+        self.log.info("Step 1: Using the shared support bundle %s", tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 1: Support bundle tar created successfully")
         self.log.info("Step 2: Validating the authserver logs in the tar")
-        self.extract_tar_file(tar_file_path, tar_dest_dir)
         auth_server_path = "{}{}".format(
             tar_dest_dir, const.AUTHSERVER_LOG_PATH)
-        resp = self.node_obj.get_file_size(auth_server_path)
-        assert_true(resp[0], resp[1])
+        resp = self.get_file_sizes([auth_server_path])
+        assert_true(resp.get(auth_server_path, 0) > 0, f"{auth_server_path} is missing or empty")
         self.log.info("Step 2: Validated the authserver logs of the tar")
         self.log.info(
             "ENDED: Validate Support bundle contains authserver logs")
@@ -767,36 +1012,23 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8700")
+    @pytest.mark.usefixtures("shared_bundle")
     @CTFailOn(error_handler)
     def test_haproxy_logs_5284(self):
         """Validate Support bundle contains haproxy logs."""
         self.log.info(
             "STARTED: Validate Support bundle contains haproxy logs")
-        bundle_name = self.bundle_prefix.format("5284")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
-        self.log.info(
-            "Step 1: Creating support bundle %s.tar.gz", bundle_name)
-        resp = self.create_support_bundle(
-            bundle_name, remote_path, self.host_ip)
-        assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        tar_file_path = self.shared_bundle_paths["tar_file_path"]
+        tar_dest_dir = self.shared_bundle_paths["tar_dest_dir"]
+        self.log.info("Step 1: Using the shared support bundle %s", tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 1: Support bundle tar created successfully")
         self.log.info("Step 2: Validating the haproxy logs in the tar")
-        self.extract_tar_file(tar_file_path, tar_dest_dir)
         auth_server_path = "{}{}".format(
             tar_dest_dir, const.HAPROXY_LOG_PATH)
-        resp = self.node_obj.get_file_size(auth_server_path)
-        assert_true(resp[0], resp[1])
+        resp = self.get_file_sizes([auth_server_path])
+        assert_true(resp.get(auth_server_path, 0) > 0, f"{auth_server_path} is missing or empty")
         self.log.info("Step 2: Validated the haproxy logs of the tar")
         self.log.info(
             "ENDED: Validate Support bundle contains haproxy logs")
@@ -807,36 +1039,28 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8693")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collection_s3server_down_5275(self):
         """Test Support bundle collection when s3server services are down."""
         self.log.info(
             "STARTED: Test Support bundle collection when s3server services are down")
-        bundle_name = self.bundle_prefix.format("5275")
-        common_dir = self.common_dir
-        remote_path = os.path.join(common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, common_dir)
+        bundle_name, remote_path, _, tar_file_path = self._prepare_bundle("5275")
         self.log.info("Step 1: Stopping the s3server services")
         self.pcs_start = False
         resp = S3H_OBJ.enable_disable_s3server_instances(
             resource_disable=True)
         assert_true(resp[0], resp[1])
-        resp = S3H_OBJ.check_s3services_online()
-        assert_false(resp[0], resp[1])
+        # Pacemaker stops the resources asynchronously
+        resp = self.poll_s3server_roles("Stopped")
+        assert_true(resp[0], f"s3server resources are not stopped: {resp[1]}")
         self.log.info("Step 1: s3server services was stopped successfully")
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(
-            remote_path, tar_dest_dir, bundle_tar_name)
         self.log.info(
             "Step 2: Creating support bundle %s.tar.gz", bundle_name)
         resp = self.create_support_bundle(
             bundle_name, remote_path, self.host_ip)
         assert_true(resp[0], resp[1])
-        resp = self.node_obj.path_exists(tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 2: Support bundle created successfully")
         resp = S3H_OBJ.enable_disable_s3server_instances(
@@ -850,21 +1074,13 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8701")
+    @pytest.mark.usefixtures("remote_workdir")
     @CTFailOn(error_handler)
     def test_collection_script_5270(self):
         """Test Support bundle collection through command/script."""
         self.log.info(
             "STARTED: Test Support bundle collection through command/script")
-        bundle_name = self.bundle_prefix.format("5270")
-        common_dir = self.common_dir
-        dir_path = os.path.join(common_dir, self.sys_bundle_dir)
-        remote_path = self.node_obj.make_dir(dir_path)
-        assert_true(remote_path, dir_path)
-        self.file_lst.append(os.path.join(dir_path))
-        tar_dest_dir = os.path.join(dir_path, common_dir)
-        bundle_tar_name = "s3_{}.{}".format(
-            bundle_name, self.tar_postfix)
-        tar_file_path = os.path.join(tar_dest_dir, bundle_tar_name)
+        bundle_name, dir_path, _, tar_file_path = self._prepare_bundle("5270")
         self.log.info(
             "Step 1: Creating support bundle %s.tar.gz", bundle_name)
         resp = self.create_support_bundle(
@@ -873,56 +1089,57 @@ class TestSupportBundle:
         self.log.info(
             "Step 1: Created support bundle %s.tar.gz", bundle_name)
         self.log.info("Step 2: Verifying that support bundle is created")
-        resp = self.node_obj.path_exists(tar_file_path)
+        resp = self.remote_path_exists(tar_file_path)
         assert_true(resp, f"Support bundle does not exist at {tar_file_path}")
         self.log.info("Step 2: Verified that support bundle is created")
         self.log.info(
             "ENDED: Test Support bundle collection through command/script")
 
+    @pytest.mark.parallel
+    @pytest.mark.s3_ops
+    @pytest.mark.s3_support_bundle
+    @pytest.mark.usefixtures("remote_workdir")
+    @pytest.mark.parametrize("dir_suffix", ["", "/"])
+    def test_bundle_tar_path_on_node(self, dir_suffix):
+        """Tar path built for a bundle matches the tar the bundle script wrote."""
+        self.log.info("STARTED: Test tar path of a created support bundle")
+        bundle_name = self.bundle_prefix.format("tar_path")
+        dest_dir = self.work_dir + dir_suffix
+        _, tar_file_path = _bundle_tar_paths(bundle_name, dest_dir)
+        self.log.info("Step 1: Creating support bundle %s in %s", bundle_name, dest_dir)
+        resp = self.create_support_bundle(bundle_name, dest_dir, self.host_ip)
+        assert_true(resp[0], resp[1])
+        self.log.info("Step 2: Listing %s on the node", tar_file_path)
+        resp = self.remote_execution("ls -d -- {}".format(shlex.quote(tar_file_path)))
+        assert_true(resp[0], resp[1])
+        listed = resp[1].decode("utf-8").strip()
+        assert_true(listed == tar_file_path, f"Listed {listed}, expected {tar_file_path}")
+        self.log.info("ENDED: Test tar path of a created support bundle")
+
     @pytest.mark.parallel
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8689")
+    @pytest.mark.usefixtures("shared_bundle")
     @CTFailOn(error_handler)
     def test_system_configs_5285(self):
         """Validate Support bundle contains system related configs."""
         self.log.info(
             "STARTED: Validate Support bundle contains system related configs")
-        bundle_name = self.bundle_prefix.format("5285")
-        common_dir = self.common_dir
-        ex_cfg_files = []
-        dir_path = os.path.join(common_dir, self.sys_bundle_dir)
-        remote_path = self.node_obj.make_dir(dir_path)
-        assert_true(remote_path, f"Failed to create directory: {dir_path}")
-        self.file_lst.append(os.path.join(dir_path))
-        tar_dest_dir = os.path.join(dir_path, self.common_dir)
-        bundle_name = "{0}_{1}".format(bundle_name, str(1))
-        bundle_tar_name = "s3_{0}.{1}".format(
-            bundle_name, self.tar_postfix)
-        self.log.info(
-            "Step 1: Creating support bundle %s", bundle_tar_name)
-        resp = self.create_support_bundle(
-            bundle_name, dir_path, self.host_ip)
-        assert_true(resp[0], resp[1])
-        self.log.info(
-            "Step 1: Created support bundle successfully: %s %s",
-            bundle_name, resp)
-        tar_file_path = os.path.join(
-            dir_path, tar_dest_dir, bundle_tar_name)
+        tar_file_path = self.shared_bundle_paths["tar_file_path"]
+        tar_dest_dir = self.shared_bundle_paths["tar_dest_dir"]
         self.log.info(
-            "Step 2: Extracting the support bundle %s", bundle_tar_name)
-        self.extract_tar_file(tar_file_path, tar_dest_dir)
-        self.log.info(
-            "Step 2: Extracted the support bundle %s", bundle_tar_name)
+            "Step 1 and 2: Using the shared extracted support bundle %s", tar_file_path)
         self.log.info(
             "Step 3: Checking config files are present under %s after "
             "extracting a support bundle", tar_dest_dir)
         cfg_5285 = const.CFG_FILES
-        for file in cfg_5285:
-            file_path = f"{tar_dest_dir}{file}"
-            resp = self.node_obj.path_exists(file_path)
-            assert_true(resp, f"Support bundle does not exist at {file_path}")
-            ex_cfg_files.append(file_path)
+        ex_cfg_files = [f"{tar_dest_dir}{file}" for file in cfg_5285]
+        # Existence of all the extracted config files from a single remote stat
+        file_sizes = self.get_file_sizes(ex_cfg_files)
+        for file_path in ex_cfg_files:
+            assert_true(file_path in file_sizes,
+                        f"Support bundle does not exist at {file_path}")
         self.log.info(
             "Step 3: Checked for config files are present under %s after "
             "extracting a support bundle", tar_dest_dir)
@@ -938,47 +1155,35 @@ class TestSupportBundle:
     @pytest.mark.s3_ops
     @pytest.mark.s3_support_bundle
     @pytest.mark.tags("TEST-8690")
+    @pytest.mark.usefixtures("shared_bundle")
     @CTFailOn(error_handler)
     def test_collect_system_info_stats_5286(self):
         """Validate Support bundle collects system information and stats."""
         self.log.info("STARTED: Validate Support bundle collects system information and stats")
-        bundle_name = self.bundle_prefix.format("5286")
-        stat_files = []
-        remote_path = os.path.join(self.common_dir, self.sys_bundle_dir)
-        resp = self.node_obj.make_dir(remote_path)
-        assert_true(resp, remote_path)
-        self.file_lst.append(os.path.join(remote_path))
-        tar_dest_dir = os.path.join(remote_path, self.common_dir)
-        bundle_name = "{0}_{1}".format(bundle_name, str(1))
-        bundle_tar_name = "s3_{0}.{1}".format(bundle_name, self.tar_postfix)
-        self.log.info("Step 1: Creating support bundle %s", bundle_tar_name)
-        resp = self.create_support_bundle(bundle_name, remote_path, self.host_ip)
-        assert_true(resp[0], resp[1])
-        self.log.info("Step 1: Created support bundle successfully: %s, %s", bundle_name, resp)
-        tar_file_path = os.path.join(remote_path, tar_dest_dir, bundle_tar_name)
-        self.log.info("Step 2: Extracting the support bundle %s", bundle_tar_name)
-        self.extract_tar_file(tar_file_path, tar_dest_dir)
-        self.log.info("Step 2: Extracted the support bundle %s", bundle_tar_name)
+        tar_file_path = self.shared_bundle_paths["tar_file_path"]
+        tar_dest_dir = self.shared_bundle_paths["tar_dest_dir"]
+        self.log.info(
+            "Step 1 and 2: Using the shared extracted support bundle %s", tar_file_path)
         self.log.info("Step 3: Checking if system level stat files are collected")
         tmp_stat_files_dir = self.tmp_dir
-        stat_files_dir = self.pysftp_obj.listdir(os.path.join(
+        stat_files_dir = self.list_remote_dir(posixpath.join(
             tar_dest_dir, tmp_stat_files_dir))
-        bundle_stat_dir = [
-            dir_el for dir_el in stat_files_dir if "s3_support_bundle_" in dir_el][0]
-        stat_dir_path = os.path.join(
+        bundle_stat_dir = next(
+            (dir_el for dir_el in stat_files_dir if "s3_support_bundle_" in dir_el), None)
+        assert_true(bundle_stat_dir, f"No stat dir in {stat_files_dir}")
+        stat_dir_path = posixpath.join(
             tar_dest_dir,
             tmp_stat_files_dir,
             bundle_stat_dir)
-        for file in S3_CFG["stat_files"]:
-            stat_file_path = f"{stat_dir_path}/{file}"
-            resp = self.node_obj.path_exists(stat_file_path)
-            assert_true(resp, f"Support bundle does not exist at {stat_file_path}")
-            stat_files.append(stat_file_path)
+        stat_files = [f"{stat_dir_path}/{file}" for file in S3_CFG["stat_files"]]
+        file_sizes = self.get_file_sizes(stat_files)
+        for stat_file_path in stat_files:
+            assert_true(stat_file_path in file_sizes,
+                        f"Support bundle does not exist at {stat_file_path}")
         self.log.info("Step 3: Checked that system level stat files are collected")
         self.log.info("Step 4 : Verifying that system level stat files are not empty")
         for file in stat_files:
-            resp = self.node_obj.get_file_size(file)
-            assert_true(resp[0], resp[1])
+            assert_true(file_sizes[file] > 0, f"{file} is empty")
         self.log.info(
             "Step 4 : Verified that system level stat files are not empty")
         self.log.info("ENDED: Validate Support bundle collects system information and stats")
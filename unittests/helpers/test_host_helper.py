@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""UnitTest module to test Host helper methods without a remote host."""
+
+from unittest import mock
+
+from commons.helpers.host import BATCH_SEPARATOR
+from commons.helpers.host import Host
+from commons.utils import assert_utils
+
+
+class TestHostExecuteBatch:
+    """Test splitting the output of a command batch."""
+
+    # pylint: disable=attribute-defined-outside-init
+    def setup_method(self):
+        """Host which is never connected, execute_cmd is mocked per test."""
+        self.host = Host(hostname="node1", username="root", password="password")
+
+    def test_commands_joined_with_separator(self):
+        """The commands run in one execute_cmd call, with the separator echoed between."""
+        with mock.patch.object(self.host, "execute_cmd", return_value=b"a\n") as execute_cmd:
+            self.host.execute_batch(["echo a", "echo b"], read_lines=False)
+        execute_cmd.assert_called_once_with(
+            cmd=f"echo a; echo {BATCH_SEPARATOR}; echo b", read_lines=False)
+
+    def test_output_split_per_command(self):
+        """Every command gets its own decoded output, in command order."""
+        output = f"a\n{BATCH_SEPARATOR}\nb\n{BATCH_SEPARATOR}\nc\n".encode()
+        with mock.patch.object(self.host, "execute_cmd", return_value=output):
+            resp = self.host.execute_batch(["echo a", "echo b", "echo c"])
+        assert_utils.assert_equal(resp, ["a\n", "b\n", "c\n"], resp)
+
+    def test_output_without_trailing_newline(self):
+        """Output not ending with a newline is still split at the separator."""
+        output = f"a{BATCH_SEPARATOR}\n\n{BATCH_SEPARATOR}\nc".encode()
+        with mock.patch.object(self.host, "execute_cmd", return_value=output):
+            resp = self.host.execute_batch(["printf a", "echo", "printf c"])
+        assert_utils.assert_equal(resp, ["a", "\n", "c"], resp)
+
+    def test_tuple_output(self):
+        """Only the stdout of an (output, error) response is split."""
+        output = (f"a\n{BATCH_SEPARATOR}\nb\n".encode(), b"")
+        with mock.patch.object(self.host, "execute_cmd", return_value=output):
+            resp = self.host.execute_batch(["echo a", "echo b"], exc=False)
+        assert_utils.assert_equal(resp, ["a\n", "b\n"], resp)
@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""UnitTest module for the cached yaml config reader."""
+
+import os
+from collections import OrderedDict
+from unittest import mock
+
+from commons import configmanager
+from commons.utils import assert_utils
+
+
+class TestGetConfigYaml:
+    """Test the parsed yaml cache of get_config_yaml."""
+
+    # pylint: disable=attribute-defined-outside-init
+    def setup_method(self):
+        """Start every test with an empty cache and without decryption."""
+        self.cache_patch = mock.patch.object(configmanager, "_YAML_CACHE", OrderedDict())
+        self.decrypt_patch = mock.patch.object(
+            configmanager.pswdmanager, "decrypt_all_passwd")
+        self.cache_patch.start()
+        self.decrypt_patch.start()
+
+    def teardown_method(self):
+        """Restore the module cache."""
+        self.decrypt_patch.stop()
+        self.cache_patch.stop()
+
+    @staticmethod
+    def write_yaml(path, content):
+        """Write the yaml file and move its mtime so that a rewrite is always seen."""
+        path.write_text(content)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    def test_unchanged_file_parsed_once(self, tmp_path):
+        """An unchanged file is parsed only on the first read."""
+        fpath = tmp_path / "setup.yaml"
+        self.write_yaml(fpath, "nodes:\n  host: node1\n")
+        with mock.patch.object(configmanager.yaml, "safe_load",
+                               wraps=configmanager.yaml.safe_load) as safe_load:
+            first = configmanager.get_config_yaml(str(fpath))
+            second = configmanager.get_config_yaml(str(fpath))
+        assert_utils.assert_equal(safe_load.call_count, 1, safe_load.call_args_list)
+        assert_utils.assert_equal(first, second, "Cached config differs")
+
+    def test_returned_config_is_a_deep_copy(self, tmp_path):
+        """Changes of a caller to its config are not seen by the next reader."""
+        fpath = tmp_path / "setup.yaml"
+        self.write_yaml(fpath, "nodes:\n  host: node1\n")
+        first = configmanager.get_config_yaml(str(fpath))
+        first["nodes"]["host"] = "changed"
+        second = configmanager.get_config_yaml(str(fpath))
+        assert_utils.assert_equal(second["nodes"]["host"], "node1", second)
+
+    def test_modified_file_parsed_again(self, tmp_path):
+        """A rewritten file gets a new cache key and is parsed again."""
+        fpath = tmp_path / "setup.yaml"
+        self.write_yaml(fpath, "nodes:\n  host: node1\n")
+        configmanager.get_config_yaml(str(fpath))
+        self.write_yaml(fpath, "nodes:\n  host: node2\n")
+        config = configmanager.get_config_yaml(str(fpath))
+        assert_utils.assert_equal(config["nodes"]["host"], "node2", config)
+
+    def test_least_recently_used_entry_evicted(self, tmp_path):
+        """Over the cache size the least recently read file is dropped first."""
+        paths = []
+        for index in range(3):
+            fpath = tmp_path / f"setup{index}.yaml"
+            self.write_yaml(fpath, f"index: {index}\n")
+            paths.append(str(fpath))
+        with mock.patch.object(configmanager, "_YAML_CACHE_SIZE", 2):
+            configmanager.get_config_yaml(paths[0])
+            configmanager.get_config_yaml(paths[1])
+            # Reading the first file again makes the second one the oldest
+            configmanager.get_config_yaml(paths[0])
+            configmanager.get_config_yaml(paths[2])
+        cached = [key[0] for key in configmanager._YAML_CACHE]
+        assert_utils.assert_equal(cached, [paths[0], paths[2]], cached)
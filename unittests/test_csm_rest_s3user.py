@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""UnitTest module for the s3 account listing helpers of RestS3user, with mocked listings."""
+
+from unittest import mock
+
+from commons.utils import assert_utils
+from libs.csm.rest.csm_rest_s3user import RestS3user
+from libs.csm.rest.csm_rest_s3user import _match_acc
+
+
+class TestS3AccountsIndex:
+    """Test indexing the parsed s3 accounts listing by account name."""
+
+    # pylint: disable=attribute-defined-outside-init
+    def setup_method(self):
+        """RestS3user without the session and cluster setup of its __init__."""
+        self.s3user = RestS3user.__new__(RestS3user)
+        self.s3user._list_index = None
+        self.accounts = [{"account_name": "acc1", "account_email": "acc1@seagate.com"},
+                         {"account_name": "acc2", "account_email": "acc2@seagate.com"}]
+
+    def test_index_by_account_name(self):
+        """Every listed account is found under its name."""
+        with mock.patch.object(self.s3user, "_get_s3_accounts_parsed",
+                               return_value=self.accounts):
+            index = self.s3user._get_s3_accounts_index()
+        assert_utils.assert_equal(index, {"acc1": self.accounts[0],
+                                          "acc2": self.accounts[1]}, index)
+
+    def test_index_reused_for_same_listing(self):
+        """The index is built once per listing object."""
+        with mock.patch.object(self.s3user, "_get_s3_accounts_parsed",
+                               return_value=self.accounts):
+            first = self.s3user._get_s3_accounts_index()
+            second = self.s3user._get_s3_accounts_index()
+        assert_utils.assert_true(first is second, "Index rebuilt for the same listing")
+
+    def test_index_rebuilt_for_new_listing(self):
+        """A new listing replaces the index of the previous one."""
+        with mock.patch.object(self.s3user, "_get_s3_accounts_parsed",
+                               return_value=self.accounts):
+            self.s3user._get_s3_accounts_index()
+        new_accounts = self.accounts[:1]
+        with mock.patch.object(self.s3user, "_get_s3_accounts_parsed",
+                               return_value=new_accounts):
+            index = self.s3user._get_s3_accounts_index()
+        assert_utils.assert_equal(list(index), ["acc1"], index)
+
+    def test_failed_listing(self):
+        """A failed listing gives an empty index."""
+        with mock.patch.object(self.s3user, "_get_s3_accounts_parsed", return_value=None):
+            index = self.s3user._get_s3_accounts_index()
+        assert_utils.assert_equal(index, {}, index)
+
+
+class TestMatchAccount:
+    """Test matching a listed s3 account against the expected one."""
+
+    def test_name_and_email_match(self):
+        """An account with the expected name and email matches."""
+        actual = {"account_name": "acc1", "account_email": "acc1@seagate.com"}
+        assert_utils.assert_true(_match_acc(actual, "acc1", "acc1@seagate.com"), actual)
+
+    def test_wrong_email(self):
+        """The email has to match as well as the name."""
+        actual = {"account_name": "acc1", "account_email": "acc2@seagate.com"}
+        assert_utils.assert_false(_match_acc(actual, "acc1", "acc1@seagate.com"), actual)
+
+    def test_missing_keys(self):
+        """An entry without name or email does not match."""
+        assert_utils.assert_false(_match_acc({}, "acc1", "acc1@seagate.com"), "{} matched")
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""UnitTest module for the login cache of the CSM REST test lib, with mocked REST calls."""
+
+import logging
+from unittest import mock
+
+from commons.constants import Rest as const
+from commons.utils import assert_utils
+from libs.csm.rest.csm_rest_test_lib import RestTestLib
+
+
+class _CachedLoginLib(RestTestLib):
+    """RestTestLib without the cluster setup of its __init__."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self):
+        self.log = logging.getLogger(__name__)
+        self.config = {"csm_admin_user": {"username": "admin", "password": "password"},
+                       "rest_logout_endpoint": "/api/v2/logout"}
+        self.restapi = mock.Mock()
+        self.restapi.rest_call.return_value = mock.Mock(status_code=const.SUCCESS_STATUS)
+        self.headers = {}
+        self._auth_cache = {}
+        self.login_count = 0
+        self.sent_headers = []
+
+    def rest_login(self, login_as):
+        """Hand out a new token on every login."""
+        self.login_count += 1
+        response = mock.Mock(status_code=const.SUCCESS_STATUS)
+        response.headers = {"Authorization": f"Bearer token{self.login_count}"}
+        return response
+
+    @RestTestLib.authenticate_and_login
+    def call(self, status_code=const.SUCCESS_STATUS):
+        """Decorated REST call answering with the given status code."""
+        self.sent_headers.append(dict(self.headers))
+        return mock.Mock(status_code=status_code)
+
+    @RestTestLib.rest_logout
+    @RestTestLib.authenticate_and_login
+    def call_and_logout(self):
+        """Decorated REST call followed by a logout."""
+        return mock.Mock(status_code=const.SUCCESS_STATUS)
+
+
+class TestAuthCache:
+    """Test reusing and dropping cached login headers."""
+
+    # pylint: disable=attribute-defined-outside-init
+    def setup_method(self):
+        """Fresh lib and cache for every test."""
+        self.lib = _CachedLoginLib()
+
+    def test_login_reused_within_ttl(self):
+        """Calls inside the TTL reuse the login without any other request."""
+        self.lib.call()
+        self.lib.call()
+        assert_utils.assert_equal(self.lib.login_count, 1, "Logged in again")
+        assert_utils.assert_false(self.lib.restapi.rest_call.called,
+                                  self.lib.restapi.rest_call.call_args_list)
+        assert_utils.assert_equal(self.lib.sent_headers[1]["Authorization"],
+                                  "Bearer token1", self.lib.sent_headers)
+
+    def test_login_after_ttl(self):
+        """A cached login older than the TTL is replaced by a new one."""
+        self.lib.call()
+        key = self.lib.get_auth_cache_key("csm_admin_user")
+        headers, login_time = self.lib._auth_cache[key]
+        self.lib._auth_cache[key] = (headers, login_time - const.AUTH_CACHE_TTL - 1)
+        self.lib.call()
+        assert_utils.assert_equal(self.lib.login_count, 2, "Expired login reused")
+
+    def test_unauthorized_drops_login(self):
+        """A 401 drops the cached login without replaying the call."""
+        self.lib.call()
+        resp = self.lib.call(status_code=const.UNAUTHORIZED)
+        assert_utils.assert_equal(resp.status_code, const.UNAUTHORIZED, resp)
+        assert_utils.assert_equal(len(self.lib.sent_headers), 2, "Call was replayed")
+        assert_utils.assert_equal(self.lib._auth_cache, {}, self.lib._auth_cache)
+        self.lib.call()
+        assert_utils.assert_equal(self.lib.login_count, 2, "Rejected login reused")
+
+    def test_logout_clears_cache(self):
+        """Logging out drops every cached login."""
+        self.lib.call_and_logout()
+        assert_utils.assert_equal(self.lib._auth_cache, {}, self.lib._auth_cache)
+        self.lib.call()
+        assert_utils.assert_equal(self.lib.login_count, 2, "Logged out token reused")
+
+    def test_cached_headers_not_shared(self):
+        """Headers changed by a caller do not leak into the cached login."""
+        self.lib.call()
+        self.lib.headers["Content-Type"] = "application/json"
+        self.lib.call()
+        assert_utils.assert_not_in("Content-Type", self.lib.sent_headers[1],
+                                   self.lib.sent_headers)
@@ -0,0 +1,38 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Unittests for ras core lib helpers which need no node
+"""
+import pytest
+
+from libs.ras.ras_core_lib import _encrypted_token
+
+
+@pytest.mark.parametrize("output, expected", [
+    (b"b'gAAAAABh_x=='\n", "gAAAAABh_x=="),
+    (b'b"gAAAAABh_x=="\n', "gAAAAABh_x=="),
+    (b"Encrypted password: b'gAAAAABh_x=='\n", "gAAAAABh_x=="),
+    (b"gAAAAABh_x==", "gAAAAABh_x=="),
+    (b"b'gAAAAABh_x==\"", "b'gAAAAABh_x==\""),
+])
+def test_encrypted_token(output, expected):
+    """Token is taken from the last field, without its bytes literal quotes."""
+    assert _encrypted_token(output) == expected